@@ -8,13 +8,16 @@ and contains only orchestration logic — no framework-specific code.
 from __future__ import annotations
 
 import base64
-import io
 import logging
 import os
-import uuid
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from contextlib import closing
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from operator import attrgetter
+from typing import BinaryIO, Iterator, Optional, Union
 
 from app.domain.entities import (
     ALLOWED_MIME_TYPES,
@@ -25,10 +28,15 @@ from app.domain.entities import (
     Signature,
     SignerIdentity,
     SignerType,
+    is_twelve_digits,
+    new_id,
+    utcnow,
 )
 from app.domain.exceptions import (
     AccessDeniedError,
     DocumentNotFoundError,
+    DomainError,
+    FileStorageError,
     InvalidDocumentError,
     PackageNotFoundError,
     SigningError,
@@ -38,6 +46,7 @@ from app.domain.exceptions import (
 from app.domain.ports import (
     DocumentRepository,
     FileStorage,
+    IdGenerator,
     PackageRepository,
     SignatureRepository,
     SigningService,
@@ -46,72 +55,188 @@ from app.domain.ports import (
 
 logger = logging.getLogger(__name__)
 
+# Listed in the "unsupported file type" error; built once, not per rejection.
+_ALLOWED_MIME_TYPES_TEXT = ", ".join(sorted(ALLOWED_MIME_TYPES))
+
+# Document attributes shown in document listings, fetched in one C-level call.
+_document_list_fields = attrgetter(
+    "id", "title", "filename", "mime_type", "file_size", "sha256", "status",
+    "sigex_document_id", "package_id", "created_at",
+)
+
+# Upper bound for concurrent per-document work in package signing.
+_MAX_PACKAGE_WORKERS = 32
+
+# Upper bound for files stored concurrently by a multi-file upload.
+_MAX_UPLOAD_WORKERS = 8
+
+# Runs Sigex data uploads alongside the local writes of the post-signing step.
+# Shared and never waited on by its own tasks, so it is safe to use from the
+# package-signing worker threads.
+_upload_executor = ThreadPoolExecutor(
+    max_workers=_MAX_PACKAGE_WORKERS, thread_name_prefix="sigex-upload"
+)
+
+# Read size used when copying files into a package ZIP.
+_ZIP_CHUNK_SIZE = 1024 * 1024
+
+# Formats that are already compressed; deflating them only burns CPU.
+_PRECOMPRESSED_MIME_TYPES = frozenset({
+    "application/pdf",
+    "image/png",
+    "image/jpeg",
+})
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _process_document_after_signing(
+def _upload_from_storage(
     document: Document,
-    file_data: bytes,
-    signature_b64: str,
-    signer: SignerIdentity,
-    document_repo: DocumentRepository,
-    signature_repo: SignatureRepository,
+    sigex_doc_id: str,
     file_storage: FileStorage,
     signing_service: SigningService,
 ) -> dict:
-    """Post-signing processing for a single document.
+    """Stream a stored document to Sigex without loading it into memory."""
+    with closing(file_storage.open_stream(document.file_path)) as f:
+        return signing_service.upload_document_data(
+            sigex_doc_id, f, size=document.file_size
+        )
+
 
-    Registers the document in Sigex, saves the signature record and files,
-    marks the document as signed.  Returns a result dict.
+def _sign_document_files(
+    document: Document,
+    signature_b64: str,
+    signer: SignerIdentity,
+    file_storage: FileStorage,
+    signing_service: SigningService,
+    signature_id: Optional[str] = None,
+) -> Signature:
+    """Sigex and storage part of post-signing for a single document.
+
+    Registers the document in Sigex and writes the signature and signed
+    files. Updates the document entity and returns the signature record;
+    neither is saved, so this can run on a worker thread that has no
+    database access (see _save_signed_document).
     """
     sigex_doc_id = signing_service.register_document(
         title=document.title,
         description=f"Document: {document.filename}",
         signature=signature_b64,
     )
-    signing_service.upload_document_data(sigex_doc_id, file_data)
-    document.mark_registered(sigex_doc_id)
-
-    # Save signature record
-    signature = Signature(
-        document_id=document.id,
-        signer_iin=signer.iin,
-        signer_name=signer.full_name,
-        signer_type=signer.signer_type,
-        signer_bin=signer.bin,
-        signer_company=signer.company_name,
+    # The data upload is the slowest step; the local file writes below do not
+    # depend on it, so they run while it is in flight.
+    upload = _upload_executor.submit(
+        _upload_from_storage, document, sigex_doc_id, file_storage, signing_service
     )
-    signature.mark_completed(signature_b64)
-    signature_repo.save(signature)
+    try:
+        signature = Signature(
+            id=signature_id or new_id(),
+            document_id=document.id,
+            signer_iin=signer.iin,
+            signer_name=signer.full_name,
+            signer_type=signer.signer_type,
+            signer_bin=signer.bin,
+            signer_company=signer.company_name,
+        )
+        now = utcnow()
+        signature.mark_completed(signature_b64, now=now)
 
-    # Save signature file
-    sig_path = f"documents/{document.id}/signatures/{signature.id}.cms"
-    sig_data = base64.b64decode(signature_b64)
-    file_storage.save_file(sig_path, sig_data)
-    document.signature_file_path = sig_path
+        # Save signature file
+        sig_path = f"documents/{document.id}/signatures/{signature.id}.cms"
+        file_storage.save_file(sig_path, base64.b64decode(signature_b64))
+
+        # Save signed copy
+        signed_file_path = (
+            f"documents/{document.id}/{document.stem}-sigex{sigex_doc_id}{document.ext}"
+        )
+        file_storage.link_file(document.file_path, signed_file_path)
+    except BaseException:
+        wait([upload])
+        raise
+    upload.result()
 
-    # Save signed copy
-    name, ext = os.path.splitext(document.filename)
-    signed_filename = f"{name}-sigex{sigex_doc_id}{ext}"
-    signed_file_path = f"documents/{document.id}/{signed_filename}"
-    file_storage.save_file(signed_file_path, file_data)
+    document.mark_registered(sigex_doc_id, now=now)
+    document.signature_file_path = sig_path
     document.signed_file_path = signed_file_path
+    document.mark_signed(now=now)
+    return signature
 
-    document.mark_signed()
+
+def _save_signed_document(
+    document: Document,
+    signature: Signature,
+    document_repo: DocumentRepository,
+    signature_repo: SignatureRepository,
+) -> dict:
+    """Persist the result of _sign_document_files. Returns a result dict."""
+    signature_repo.save(signature)
     document_repo.update(document)
 
     return {
         "document_id": document.id,
         "signature_id": signature.id,
-        "sigex_document_id": sigex_doc_id,
+        "sigex_document_id": document.sigex_document_id,
     }
 
 
+class _ZipChunkSink:
+    """Write-only, unseekable file object that buffers ZIP output until drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._chunks)
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _HashingReader:
+    """Binary reader wrapper that hashes and counts bytes as they pass through."""
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._hasher = Document.new_hasher()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self._hasher.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        readinto = getattr(self._raw, "readinto", None)
+        if readinto is None:
+            chunk = self._raw.read(len(buffer))
+            n = len(chunk)
+            buffer[:n] = chunk
+        else:
+            n = readinto(buffer) or 0
+        view = memoryview(buffer)[:n]
+        self._hasher.update(view)
+        self.size += n
+        return n
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
 # ── DTOs ─────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class UploadResult:
     document_id: str
     title: str
@@ -120,7 +245,7 @@ class UploadResult:
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QRSigningResult:
     session_id: str
     document_id: str
@@ -131,14 +256,26 @@ class QRSigningResult:
     sign_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class SignatureSummary:
+    id: str
+    signer_name: str
+    signer_iin: str
+    signer_type: str
+    status: str
+    signed_at: Optional[datetime]
+
+
+@dataclass(slots=True)
 class SigningStatusResult:
     document_id: str
     status: str
-    signatures: list[dict]
+    signatures: list[SignatureSummary]
+    # The loaded entity, for callers that show more than the status.
+    document: Optional[Document] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     document_id: str
     verified: bool
@@ -154,38 +291,90 @@ class UploadDocumentUseCase:
         self,
         document_repo: DocumentRepository,
         file_storage: FileStorage,
+        id_generator: Optional[IdGenerator] = None,
     ):
         self.document_repo = document_repo
         self.file_storage = file_storage
+        self.new_id = id_generator.new_id if id_generator else new_id
 
     def execute(
         self,
-        file_data: bytes,
+        file_obj: BinaryIO,
         filename: str,
         mime_type: str,
         title: str,
         owner_id: int,
         package_id: Optional[str] = None,
     ) -> UploadResult:
-        if mime_type not in ALLOWED_MIME_TYPES:
+        document = self._store(
+            file_obj, filename, mime_type, title, owner_id, package_id
+        )
+        return self._save(document)
+
+    def execute_many(
+        self,
+        files: list[tuple[BinaryIO, str, str, str]],
+        owner_id: int,
+        package_id: Optional[str] = None,
+    ) -> list[Union[UploadResult, DomainError]]:
+        """
+        Upload several (file_obj, filename, mime_type, title) files. Returns,
+        in order, each file's UploadResult or the DomainError that rejected
+        it. Files are stored concurrently; the documents are saved from the
+        calling thread.
+        """
+        if not files:
+            return []
+
+        def store(item):
+            try:
+                return self._store(*item, owner_id, package_id)
+            except DomainError as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_UPLOAD_WORKERS, len(files))
+        ) as executor:
+            stored = list(executor.map(store, files))
+        return [
+            d if isinstance(d, DomainError) else self._save(d) for d in stored
+        ]
+
+    def _store(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        mime_type: str,
+        title: str,
+        owner_id: int,
+        package_id: Optional[str],
+    ) -> Document:
+        """Validate and store the file; returns the unsaved Document."""
+        if not Document.is_allowed_mime(mime_type):
             raise InvalidDocumentError(
                 f"Unsupported file type: {mime_type}. "
-                f"Allowed: {', '.join(ALLOWED_MIME_TYPES)}"
+                f"Allowed: {_ALLOWED_MIME_TYPES_TEXT}"
             )
 
-        doc_id = str(uuid.uuid4())
-        sha256 = Document.compute_sha256(file_data)
+        doc_id = self.new_id()
 
-        # Store file: documents/{doc_id}/{filename}
+        # Store file: documents/{doc_id}/{filename}, hashing it in the same pass
         file_path = f"documents/{doc_id}/{filename}"
-        self.file_storage.save_file(file_path, file_data)
+        reader = _HashingReader(file_obj)
+        self.file_storage.save_stream(file_path, reader)
+        sha256 = reader.hexdigest()
+        try:
+            self.file_storage.record_digest(file_path, sha256)
+        except FileStorageError as e:
+            # Only an optimisation for verification; the upload stands.
+            logger.warning("Could not record digest for %s: %s", file_path, e)
 
-        document = Document(
+        return Document(
             id=doc_id,
             title=title,
             filename=filename,
             mime_type=mime_type,
-            file_size=len(file_data),
+            file_size=reader.size,
             file_path=file_path,
             sha256=sha256,
             status=DocumentStatus.UPLOADED,
@@ -193,6 +382,7 @@ class UploadDocumentUseCase:
             package_id=package_id,
         )
 
+    def _save(self, document: Document) -> UploadResult:
         saved = self.document_repo.save(document)
 
         return UploadResult(
@@ -276,11 +466,13 @@ class CompleteQRSigningUseCase:
         signature_repo: SignatureRepository,
         file_storage: FileStorage,
         signing_service: SigningService,
+        id_generator: Optional[IdGenerator] = None,
     ):
         self.document_repo = document_repo
         self.signature_repo = signature_repo
         self.file_storage = file_storage
         self.signing_service = signing_service
+        self.new_id = id_generator.new_id if id_generator else new_id
 
     def execute(
         self,
@@ -295,40 +487,42 @@ class CompleteQRSigningUseCase:
         if document.owner_id != owner_id:
             raise AccessDeniedError("You do not own this document")
 
-        file_data = self.file_storage.read_file(document.file_path)
-
         try:
-            # Send data to sigex (long-polling — blocks until user scans QR)
-            data_b64 = base64.b64encode(file_data).decode("ascii")
+            # Send data to sigex (long-polling — blocks until user scans QR).
+            # The bytes are not kept for the polling that follows: the upload
+            # after signing streams the file from storage again.
             documents_payload = [{
                 "id": 1,
                 "nameRu": document.title,
-                "data": data_b64,
+                "data": self.file_storage.read_file(document.file_path),
                 "isPDF": document.mime_type == "application/pdf",
             }]
             self.signing_service.send_data_for_signing(
                 qr_session, documents_payload, attach_data=False
             )
+            del documents_payload
 
             # Poll for signatures
             signatures_b64 = self.signing_service.poll_signatures(qr_session)
             if not signatures_b64:
                 raise SigningError("No signatures received")
 
-            result = _process_document_after_signing(
+            signature = _sign_document_files(
                 document=document,
-                file_data=file_data,
                 signature_b64=signatures_b64[0],
                 signer=signer,
-                document_repo=self.document_repo,
-                signature_repo=self.signature_repo,
                 file_storage=self.file_storage,
                 signing_service=self.signing_service,
+                signature_id=self.new_id(),
+            )
+            result = _save_signed_document(
+                document, signature, self.document_repo, self.signature_repo
             )
 
         except SigningError as e:
-            logger.error("Signing failed for document %s: %s", document_id, e)
-            document.mark_failed(str(e))
+            error = str(e)
+            logger.error("Signing failed for document %s: %s", document_id, error)
+            document.mark_failed(error)
             self.document_repo.update(document)
             raise
 
@@ -399,12 +593,14 @@ class CompletePackageQRSigningUseCase:
         package_repo: PackageRepository,
         file_storage: FileStorage,
         signing_service: SigningService,
+        id_generator: Optional[IdGenerator] = None,
     ):
         self.document_repo = document_repo
         self.signature_repo = signature_repo
         self.package_repo = package_repo
         self.file_storage = file_storage
         self.signing_service = signing_service
+        self.new_id = id_generator.new_id if id_generator else new_id
 
     def execute(
         self,
@@ -419,79 +615,104 @@ class CompletePackageQRSigningUseCase:
         if package.owner_id != owner_id:
             raise AccessDeniedError("You do not own this package")
 
-        # Prepare all documents
-        documents_payload = []
+        docs_by_id = self.document_repo.get_many(package.document_ids)
         doc_entities = []
-        file_data_map: dict[str, bytes] = {}
+        doc_numbers: dict[str, int] = {}
         for i, doc_id in enumerate(package.document_ids):
-            doc = self.document_repo.get_by_id(doc_id)
+            doc = docs_by_id.get(doc_id)
             if not doc:
                 continue
-            file_data = self.file_storage.read_file(doc.file_path)
-            file_data_map[doc.id] = file_data
-            data_b64 = base64.b64encode(file_data).decode("ascii")
-            documents_payload.append({
-                "id": i + 1,
-                "nameRu": doc.title,
-                "data": data_b64,
-                "isPDF": doc.mime_type == "application/pdf",
-            })
+            doc_numbers[doc.id] = i + 1
             doc_entities.append(doc)
 
-        if not documents_payload:
+        if not doc_entities:
             raise InvalidDocumentError("No valid documents in package")
 
-        try:
-            # Send all data for signing (long-polling — blocks until user scans QR)
-            self.signing_service.send_data_for_signing(
-                qr_session, documents_payload, attach_data=False
+        # Each document costs several Sigex round-trips and file writes, so
+        # the per-document work is fanned out over a thread pool.
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_PACKAGE_WORKERS, len(doc_entities))
+        ) as executor:
+            file_data = executor.map(
+                lambda d: self.file_storage.read_file(d.file_path), doc_entities
             )
+            documents_payload = [
+                {
+                    "id": doc_numbers[doc.id],
+                    "nameRu": doc.title,
+                    "data": data,
+                    "isPDF": doc.mime_type == "application/pdf",
+                }
+                for doc, data in zip(doc_entities, file_data)
+            ]
 
-            # Poll for signatures
-            signatures_b64 = self.signing_service.poll_signatures(qr_session)
-
-            if len(signatures_b64) != len(doc_entities):
-                raise SigningError(
-                    f"Expected {len(doc_entities)} signatures, "
-                    f"got {len(signatures_b64)}"
-                )
-        except SigningError as e:
-            logger.error("Signing failed for package %s: %s", package_id, e)
-            for doc in doc_entities:
-                doc.mark_failed(str(e))
-                self.document_repo.update(doc)
-            package.mark_failed()
-            self.package_repo.update(package)
-            raise
-
-        # Process each document independently — one failure does not stop others
-        results = []
-        failed_count = 0
-        for doc, sig_b64 in zip(doc_entities, signatures_b64):
             try:
-                result = _process_document_after_signing(
+                # Send all data for signing (long-polling — blocks until user scans QR)
+                self.signing_service.send_data_for_signing(
+                    qr_session, documents_payload, attach_data=False
+                )
+                # Not held through polling; uploads stream from storage.
+                del documents_payload
+
+                # Poll for signatures
+                signatures_b64 = self.signing_service.poll_signatures(qr_session)
+
+                if len(signatures_b64) != len(doc_entities):
+                    raise SigningError(
+                        f"Expected {len(doc_entities)} signatures, "
+                        f"got {len(signatures_b64)}"
+                    )
+            except SigningError as e:
+                error = str(e)
+                logger.error("Signing failed for package %s: %s", package_id, error)
+                now = utcnow()
+                for doc in doc_entities:
+                    doc.mark_failed(error, now=now)
+                self.document_repo.update_many(doc_entities)
+                package.mark_failed(now=now)
+                self.package_repo.update(package)
+                raise
+
+            # Process each document independently — one failure does not stop
+            # others. Workers only talk to Sigex and the file storage; the
+            # repositories are used from this thread alone, so the workers
+            # never open database connections of their own.
+            futures = {
+                executor.submit(
+                    _sign_document_files,
                     document=doc,
-                    file_data=file_data_map[doc.id],
                     signature_b64=sig_b64,
                     signer=signer,
-                    document_repo=self.document_repo,
-                    signature_repo=self.signature_repo,
                     file_storage=self.file_storage,
                     signing_service=self.signing_service,
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(
-                    "Post-signing failed for document %s: %s", doc.id, e,
-                )
-                doc.mark_failed(str(e))
-                self.document_repo.update(doc)
-                failed_count += 1
-                results.append({
-                    "document_id": doc.id,
-                    "status": "failed",
-                    "error": str(e),
-                })
+                    signature_id=self.new_id(),
+                ): doc
+                for doc, sig_b64 in zip(doc_entities, signatures_b64)
+            }
+            results_by_doc: dict[str, dict] = {}
+            failed_count = 0
+            for future in as_completed(futures):
+                doc = futures[future]
+                try:
+                    results_by_doc[doc.id] = _save_signed_document(
+                        doc, future.result(), self.document_repo,
+                        self.signature_repo,
+                    )
+                except Exception as e:
+                    error = str(e)
+                    logger.error(
+                        "Post-signing failed for document %s: %s", doc.id, error,
+                    )
+                    doc.mark_failed(error)
+                    self.document_repo.update(doc)
+                    failed_count += 1
+                    results_by_doc[doc.id] = {
+                        "document_id": doc.id,
+                        "status": "failed",
+                        "error": error,
+                    }
+
+        results = [results_by_doc[doc.id] for doc in doc_entities]
 
         # Determine package status
         if failed_count == 0:
@@ -519,29 +740,30 @@ class GetDocumentStatusUseCase:
         self.signature_repo = signature_repo
 
     def execute(self, document_id: str, owner_id: int) -> SigningStatusResult:
-        document = self.document_repo.get_by_id(document_id)
+        document = self.document_repo.get_for_read(document_id)
         if not document:
             raise DocumentNotFoundError(document_id)
         if document.owner_id != owner_id:
             raise AccessDeniedError("You do not own this document")
 
         sigs = self.signature_repo.list_by_document(document_id)
-        sig_dicts = [
-            {
-                "id": s.id,
-                "signer_name": s.signer_name,
-                "signer_iin": s.signer_iin,
-                "signer_type": s.signer_type.value,
-                "status": s.status.value,
-                "signed_at": s.signed_at.isoformat() if s.signed_at else None,
-            }
+        summaries = [
+            SignatureSummary(
+                id=s.id,
+                signer_name=s.signer_name,
+                signer_iin=s.signer_iin,
+                signer_type=s.signer_type.value,
+                status=s.status.value,
+                signed_at=s.signed_at,
+            )
             for s in sigs
         ]
 
         return SigningStatusResult(
             document_id=document_id,
             status=document.status.value,
-            signatures=sig_dicts,
+            signatures=summaries,
+            document=document,
         )
 
 
@@ -563,59 +785,71 @@ class VerifyDocumentUseCase:
         if document.owner_id != owner_id:
             raise AccessDeniedError("You do not own this document")
 
-        file_data = self.file_storage.read_file(document.file_path)
-
-        # Verify checksum
-        checksum_match = document.verify_checksum(file_data)
+        # A digest recorded by the storage saves hashing the whole file.
+        # Otherwise the file is hashed as a stream and the result is recorded
+        # for the next check.
+        stat = self.file_storage.stat_with_digest(document.file_path)
+        if stat.sha256 is not None and stat.sha256 == document.sha256:
+            checksum_match = True
+        else:
+            with closing(self.file_storage.open_stream(document.file_path)) as f:
+                digest = Document.compute_sha256_stream(f)
+            checksum_match = digest == document.sha256
+            try:
+                self.file_storage.record_digest(document.file_path, digest)
+            except FileStorageError as e:
+                logger.warning(
+                    "Could not record digest for %s: %s", document.file_path, e
+                )
 
         # Verify via Sigex if registered
         sigex_verified = False
         if document.sigex_document_id:
             try:
-                self.signing_service.verify_document(
-                    document.sigex_document_id, file_data
-                )
+                # Streamed, so the file is never held in memory whole.
+                with closing(self.file_storage.open_stream(document.file_path)) as f:
+                    self.signing_service.verify_document(
+                        document.sigex_document_id, f, size=stat.size
+                    )
                 sigex_verified = True
             except VerificationError:
                 sigex_verified = False
 
+        verified = checksum_match and (sigex_verified or not document.sigex_document_id)
         return VerificationResult(
             document_id=document_id,
-            verified=checksum_match and (sigex_verified or not document.sigex_document_id),
+            verified=verified,
             checksum_match=checksum_match,
             sigex_verified=sigex_verified,
         )
 
 
 class ListDocumentsUseCase:
-    def __init__(
-        self,
-        document_repo: DocumentRepository,
-        package_repo: PackageRepository,
-    ):
+    def __init__(self, document_repo: DocumentRepository):
         self.document_repo = document_repo
-        self.package_repo = package_repo
 
     def execute(self, owner_id: int) -> list[dict]:
-        docs = self.document_repo.list_by_owner(owner_id)
-        packages = self.package_repo.list_by_owner(owner_id)
-        package_names = {p.id: p.title for p in packages}
-        return [
-            {
-                "id": d.id,
-                "title": d.title,
-                "filename": d.filename,
-                "mime_type": d.mime_type,
-                "file_size": d.file_size,
-                "sha256": d.sha256,
-                "status": d.status.value,
-                "sigex_document_id": d.sigex_document_id,
-                "package_id": d.package_id,
-                "package_name": package_names.get(d.package_id),
-                "created_at": d.created_at.isoformat() if d.created_at else None,
-            }
-            for d in docs
-        ]
+        rows = self.document_repo.list_by_owner_with_package_titles(owner_id)
+        result = []
+        for document, package_name in rows:
+            (
+                id_, title, filename, mime_type, file_size, sha256, status,
+                sigex_document_id, package_id, created_at,
+            ) = _document_list_fields(document)
+            result.append({
+                "id": id_,
+                "title": title,
+                "filename": filename,
+                "mime_type": mime_type,
+                "file_size": file_size,
+                "sha256": sha256,
+                "status": status.value,
+                "sigex_document_id": sigex_document_id,
+                "package_id": package_id,
+                "package_name": package_name,
+                "created_at": created_at.isoformat() if created_at else None,
+            })
+        return result
 
 
 class DownloadDocumentUseCase:
@@ -627,16 +861,17 @@ class DownloadDocumentUseCase:
         self.document_repo = document_repo
         self.file_storage = file_storage
 
-    def execute(self, document_id: str, owner_id: int) -> tuple[bytes, str, str]:
-        """Returns (file_data, filename, mime_type)."""
+    def execute(self, document_id: str, owner_id: int) -> tuple[BinaryIO, str, str]:
+        """Returns (stream, filename, mime_type). The caller must close the
+        stream."""
         document = self.document_repo.get_by_id(document_id)
         if not document:
             raise DocumentNotFoundError(document_id)
         if document.owner_id != owner_id:
             raise AccessDeniedError("You do not own this document")
 
-        file_data = self.file_storage.read_file(document.file_path)
-        return file_data, document.filename, document.mime_type
+        stream = self.file_storage.open_stream(document.file_path)
+        return stream, document.filename, document.mime_type
 
 
 class DownloadSignedDocumentUseCase:
@@ -648,8 +883,15 @@ class DownloadSignedDocumentUseCase:
         self.document_repo = document_repo
         self.file_storage = file_storage
 
-    def execute(self, document_id: str, owner_id: int) -> tuple[bytes, str, str]:
-        """Returns (file_data, signed_filename, mime_type)."""
+    def execute(
+        self, document_id: str, owner_id: int
+    ) -> tuple[Union[BinaryIO, str], str, str]:
+        """Returns (source, signed_filename, mime_type).
+
+        source is a URL the client can be redirected to when the storage
+        offers one (signed copies never change, so any copy may serve it),
+        otherwise an open stream that the caller must close.
+        """
         document = self.document_repo.get_by_id(document_id)
         if not document:
             raise DocumentNotFoundError(document_id)
@@ -660,9 +902,14 @@ class DownloadSignedDocumentUseCase:
                 f"Signed copy not available for document {document_id}"
             )
 
-        file_data = self.file_storage.read_file(document.signed_file_path)
         signed_filename = os.path.basename(document.signed_file_path)
-        return file_data, signed_filename, document.mime_type
+        url = self.file_storage.download_url(
+            document.signed_file_path, signed_filename, document.mime_type
+        )
+        if url:
+            return url, signed_filename, document.mime_type
+        stream = self.file_storage.open_stream(document.signed_file_path)
+        return stream, signed_filename, document.mime_type
 
 
 class CreatePackageUseCase:
@@ -702,14 +949,14 @@ class AddDocumentToPackageUseCase:
         if package.owner_id != owner_id:
             raise AccessDeniedError("You do not own this package")
 
-        document = self.document_repo.get_by_id(document_id)
+        # Only the owner is checked; attach_to_package writes package_id alone.
+        document = self.document_repo.get_for_read(document_id)
         if not document:
             raise DocumentNotFoundError(document_id)
         if document.owner_id != owner_id:
             raise AccessDeniedError("You do not own this document")
 
-        document.package_id = package_id
-        self.document_repo.update(document)
+        self.document_repo.attach_to_package([document_id], package_id)
 
         return {
             "package_id": package_id,
@@ -774,30 +1021,94 @@ class DownloadSignedPackageUseCase:
         self.package_repo = package_repo
         self.file_storage = file_storage
 
-    def execute(self, package_id: str, owner_id: int) -> tuple[bytes, str]:
-        """Returns (zip_bytes, zip_filename)."""
+    def execute(
+        self, package_id: str, owner_id: int
+    ) -> tuple[Iterator[bytes], str]:
+        """Returns (zip_chunks, zip_filename).
+
+        The archive is built lazily while the chunks are consumed, so only
+        one file chunk is held in memory at a time.
+        """
         package = self.package_repo.get_by_id(package_id)
         if not package:
             raise PackageNotFoundError(package_id)
         if package.owner_id != owner_id:
             raise AccessDeniedError("You do not own this package")
 
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            for doc_id in package.document_ids:
-                doc = self.document_repo.get_by_id(doc_id)
-                if not doc or doc.status != DocumentStatus.SIGNED:
-                    continue
-
-                original_data = self.file_storage.read_file(doc.file_path)
-                zf.writestr(f"originals/{doc.filename}", original_data)
-
-                if doc.signature_file_path:
-                    sig_data = self.file_storage.read_file(doc.signature_file_path)
-                    zf.writestr(f"signatures/{doc.filename}.cms", sig_data)
+        docs_by_id = self.document_repo.get_many(package.document_ids)
+        signed_docs = []
+        for doc_id in package.document_ids:
+            doc = docs_by_id.get(doc_id)
+            if doc and doc.status == DocumentStatus.SIGNED:
+                signed_docs.append(doc)
 
         zip_filename = f"package_{package_id}_signed.zip"
-        return buf.getvalue(), zip_filename
+        return self._iter_zip(signed_docs), zip_filename
+
+    def _iter_zip(self, documents: list[Document]) -> Iterator[bytes]:
+        members = []  # (name, file_path, compress, size or None)
+        for doc in documents:
+            members.append((
+                f"originals/{doc.filename}", doc.file_path,
+                doc.mime_type not in _PRECOMPRESSED_MIME_TYPES, doc.file_size or None,
+            ))
+            if doc.signature_file_path:
+                members.append((
+                    f"signatures/{doc.filename}.cms", doc.signature_file_path,
+                    True, None,
+                ))
+
+        sink = _ZipChunkSink()
+        # The next member is opened while the current one is written, so
+        # the storage round trip (an S3 GET per file) overlaps compression.
+        with ThreadPoolExecutor(max_workers=1) as opener, \
+                zipfile.ZipFile(sink, "w") as zf:
+            pending = None
+            try:
+                for i, (name, file_path, compress, size) in enumerate(members):
+                    src = (
+                        pending.result() if pending
+                        else self.file_storage.open_stream(file_path)
+                    )
+                    pending = None
+                    if i + 1 < len(members):
+                        pending = opener.submit(
+                            self.file_storage.open_stream, members[i + 1][1]
+                        )
+                    yield from self._write_member(
+                        zf, sink, name, src, compress, size
+                    )
+            finally:
+                # Download abandoned mid-archive: close the prefetched stream.
+                if pending and not pending.cancel():
+                    try:
+                        pending.result().close()
+                    except FileStorageError:
+                        pass
+        yield sink.drain()
+
+    @staticmethod
+    def _write_member(
+        zf: zipfile.ZipFile,
+        sink: _ZipChunkSink,
+        name: str,
+        src: BinaryIO,
+        compress: bool,
+        size: Optional[int],
+    ) -> Iterator[bytes]:
+        zinfo = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        # The sink cannot seek back to fix the local header, so zipfile
+        # must know up front whether the member needs ZIP64 sizes; without
+        # it, a member over 2 GiB fails mid-stream.
+        force_zip64 = size is None
+        if size is not None:
+            zinfo.file_size = size
+        with closing(src), zf.open(zinfo, "w", force_zip64=force_zip64) as dst:
+            while chunk := src.read(_ZIP_CHUNK_SIZE):
+                dst.write(chunk)
+                if sink.pending:
+                    yield sink.drain()
 
 
 class RegisterUserUseCase:
@@ -819,12 +1130,12 @@ class RegisterUserUseCase:
             raise InvalidDocumentError("Имя пользователя обязательно")
         if len(password) < 8:
             raise InvalidDocumentError("Пароль должен содержать минимум 8 символов")
-        if not iin or len(iin) != 12 or not iin.isdigit():
+        if not is_twelve_digits(iin):
             raise InvalidDocumentError("ИИН должен содержать ровно 12 цифр")
         if not full_name:
             raise InvalidDocumentError("ФИО обязательно")
         if signer_type == "legal_entity":
-            if not bin or len(bin) != 12 or not bin.isdigit():
+            if not is_twelve_digits(bin):
                 raise InvalidDocumentError(
                     "БИН должен содержать ровно 12 цифр для юридических лиц"
                 )
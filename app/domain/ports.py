@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import abc
-from typing import Optional
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Optional, Union
 
 from app.domain.entities import (
     Document,
@@ -13,6 +14,10 @@ from app.domain.entities import (
 
 
 class DocumentRepository(abc.ABC):
+    """Use cases call repositories only from the calling (request) thread,
+    never from their worker pools, so implementations may rely on
+    per-thread resources such as a database connection."""
+
     @abc.abstractmethod
     def save(self, document: Document) -> Document:
         ...
@@ -21,20 +26,64 @@ class DocumentRepository(abc.ABC):
     def get_by_id(self, document_id: str) -> Optional[Document]:
         ...
 
+    def get_for_read(self, document_id: str) -> Optional[Document]:
+        """Like get_by_id, but the result may be a few seconds old. Only for
+        read-only checks; never pass it to update()."""
+        return self.get_by_id(document_id)
+
+    @abc.abstractmethod
+    def get_many(self, document_ids: Iterable[str]) -> dict[str, Document]:
+        """Fetch several documents at once. Missing ids are omitted."""
+        ...
+
     @abc.abstractmethod
     def list_by_owner(self, owner_id: int) -> list[Document]:
         ...
 
+    @abc.abstractmethod
+    def list_by_owner_with_package_titles(
+        self, owner_id: int
+    ) -> list[tuple[Document, Optional[str]]]:
+        """Like list_by_owner, paired with each document's package title."""
+        ...
+
+    @abc.abstractmethod
+    def list_by_package(self, owner_id: int, package_id: str) -> list[Document]:
+        """Documents of owner_id that belong to the package."""
+        ...
+
+    @abc.abstractmethod
+    def list_available_for_package(self, owner_id: int) -> list[Document]:
+        """Documents of owner_id that can still be added to a package: not in
+        one yet and not signed."""
+        ...
+
+    @abc.abstractmethod
+    def list_without_package(self, owner_id: int) -> list[Document]:
+        """Documents of owner_id that are not in any package."""
+        ...
+
     @abc.abstractmethod
     def update(self, document: Document) -> Document:
         ...
 
+    @abc.abstractmethod
+    def update_many(self, documents: Iterable[Document]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def attach_to_package(self, document_ids: Iterable[str], package_id: str) -> int:
+        """Set package_id on the given documents. Returns the number updated."""
+        ...
+
     @abc.abstractmethod
     def delete(self, document_id: str) -> None:
         ...
 
 
 class SignatureRepository(abc.ABC):
+    """Called from the request thread only (see DocumentRepository)."""
+
     @abc.abstractmethod
     def save(self, signature: Signature) -> Signature:
         ...
@@ -45,6 +94,8 @@ class SignatureRepository(abc.ABC):
 
     @abc.abstractmethod
     def list_by_document(self, document_id: str) -> list[Signature]:
+        """Signatures of a document, newest first. signature_data is not
+        loaded; use get_by_id for the full record before updating one."""
         ...
 
     @abc.abstractmethod
@@ -65,6 +116,14 @@ class PackageRepository(abc.ABC):
     def list_by_owner(self, owner_id: int) -> list[Package]:
         ...
 
+    @abc.abstractmethod
+    def list_by_owner_with_documents(
+        self, owner_id: int
+    ) -> list[tuple[Package, list[Document]]]:
+        """Like list_by_owner, paired with each package's documents, newest
+        first."""
+        ...
+
     @abc.abstractmethod
     def update(self, package: Package) -> Package:
         ...
@@ -95,16 +154,62 @@ class UserRepository(abc.ABC):
         ...
 
 
+@dataclass(frozen=True, slots=True)
+class StorageStat:
+    size: int
+    # SHA-256 previously recorded with record_digest, if it is still valid
+    # for the stored bytes; None when unknown.
+    sha256: Optional[str] = None
+
+
 class FileStorage(abc.ABC):
+    """Implementations must be thread-safe: uploads, package signing and
+    package downloads call them from worker threads."""
+
     @abc.abstractmethod
     def save_file(self, file_path: str, data: bytes) -> str:
         """Save file and return the storage path."""
         ...
 
+    @abc.abstractmethod
+    def save_stream(self, file_path: str, src: BinaryIO) -> str:
+        """Save file by copying from a binary stream. Returns the storage path."""
+        ...
+
+    @abc.abstractmethod
+    def link_file(self, src_path: str, dst_path: str) -> str:
+        """Make dst_path refer to the same content as src_path without
+        re-sending the bytes. Returns dst_path."""
+        ...
+
     @abc.abstractmethod
     def read_file(self, file_path: str) -> bytes:
         ...
 
+    @abc.abstractmethod
+    def open_stream(self, file_path: str) -> BinaryIO:
+        """Open file for chunked binary reading. Caller must close it."""
+        ...
+
+    @abc.abstractmethod
+    def download_url(
+        self, file_path: str, filename: str, mime_type: str
+    ) -> Optional[str]:
+        """Short-lived URL from which a client can download the file as an
+        attachment named filename, or None if the backend has no such URL
+        and the file must be served through open_stream."""
+        ...
+
+    @abc.abstractmethod
+    def record_digest(self, file_path: str, sha256: str) -> None:
+        """Remember the SHA-256 of a stored file so that stat_with_digest can
+        report it later without reading the file."""
+        ...
+
+    @abc.abstractmethod
+    def stat_with_digest(self, file_path: str) -> StorageStat:
+        ...
+
     @abc.abstractmethod
     def delete_file(self, file_path: str) -> None:
         ...
@@ -114,8 +219,20 @@ class FileStorage(abc.ABC):
         ...
 
 
+class IdGenerator(abc.ABC):
+    """Source of entity ids. Implementations must be thread-safe."""
+
+    @abc.abstractmethod
+    def new_id(self) -> str:
+        ...
+
+
 class SigningService(abc.ABC):
-    """Port for external signing service (Sigex)."""
+    """Port for external signing service (Sigex).
+
+    Implementations must be thread-safe: package signing issues calls for
+    several documents concurrently.
+    """
 
     @abc.abstractmethod
     def register_qr_signing(self, description: str) -> QRSigningSession:
@@ -129,7 +246,12 @@ class SigningService(abc.ABC):
         documents: list[dict],
         attach_data: bool = False,
     ) -> None:
-        """Send document data to the signing session."""
+        """
+        Send document data to the signing session. Each document's "data"
+        is either a base64 string or raw bytes; raw bytes are encoded by the
+        implementation, which may stream them instead of building the whole
+        body in memory.
+        """
         ...
 
     @abc.abstractmethod
@@ -148,8 +270,17 @@ class SigningService(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def upload_document_data(self, sigex_document_id: str, data: bytes) -> dict:
-        """Upload document binary data. Returns digests."""
+    def upload_document_data(
+        self,
+        sigex_document_id: str,
+        data: Union[bytes, BinaryIO],
+        size: Optional[int] = None,
+    ) -> dict:
+        """Upload document binary data. Returns digests.
+
+        A binary stream is sent as it is read; pass its size when the stream
+        cannot report it (e.g. S3 bodies).
+        """
         ...
 
     @abc.abstractmethod
@@ -160,8 +291,14 @@ class SigningService(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def verify_document(self, sigex_document_id: str, data: bytes) -> bool:
-        """Verify document signatures against data."""
+    def verify_document(
+        self,
+        sigex_document_id: str,
+        data: Union[bytes, BinaryIO],
+        size: Optional[int] = None,
+    ) -> bool:
+        """Verify document signatures against data (bytes or a stream, as in
+        upload_document_data)."""
         ...
 
     @abc.abstractmethod
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import functools
+
 from django.conf import settings
 
 from app.domain.ports import (
     DocumentRepository,
     FileStorage,
+    IdGenerator,
     PackageRepository,
     SignatureRepository,
     SigningService,
     UserRepository,
 )
+from app.infrastructure.ids import UUID7IdGenerator
+from app.infrastructure.persistence.caching import CachedDocumentRepository
 from app.infrastructure.persistence.repositories import (
     DjangoDocumentRepository,
     DjangoPackageRepository,
@@ -22,34 +27,60 @@ from app.infrastructure.sigex.client import SigexClient
 from app.infrastructure.storage.local import LocalFileStorage
 
 
+# The repositories, id generator and storages hold no per-request state, so
+# each factory builds its object once and hands out the same instance.
+
+
+@functools.lru_cache(maxsize=1)
 def get_document_repository() -> DocumentRepository:
-    return DjangoDocumentRepository()
+    return CachedDocumentRepository(DjangoDocumentRepository())
 
 
+@functools.lru_cache(maxsize=1)
 def get_signature_repository() -> SignatureRepository:
     return DjangoSignatureRepository()
 
 
+@functools.lru_cache(maxsize=1)
 def get_package_repository() -> PackageRepository:
     return DjangoPackageRepository()
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_repository() -> UserRepository:
     return DjangoUserRepository()
 
 
+@functools.lru_cache(maxsize=1)
+def get_id_generator() -> IdGenerator:
+    return UUID7IdGenerator()
+
+
 def get_file_storage() -> FileStorage:
-    backend = getattr(settings, "FILE_STORAGE_BACKEND", "local")
+    # Keyed on the settings it depends on, so overriding them (e.g. in
+    # tests) still takes effect.
+    return _get_file_storage(
+        getattr(settings, "FILE_STORAGE_BACKEND", "local"),
+        str(settings.MEDIA_ROOT),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_file_storage(backend: str, media_root: str) -> FileStorage:
     if backend == "s3":
         from app.infrastructure.storage.s3 import S3FileStorage
         return S3FileStorage()
-    return LocalFileStorage()
+    return LocalFileStorage(media_root)
 
 
+@functools.lru_cache(maxsize=1)
 def get_signing_service() -> SigningService:
+    # One shared client, so its requests.Session keeps connections to Sigex
+    # alive across requests instead of reconnecting each time.
     return SigexClient(
         base_url=getattr(settings, "SIGEX_BASE_URL", "https://sigex.kz"),
         timeout=getattr(settings, "SIGEX_TIMEOUT", 30),
         poll_retries=getattr(settings, "SIGEX_QR_POLL_RETRIES", 60),
         poll_interval=getattr(settings, "SIGEX_QR_POLL_INTERVAL", 3),
+        max_retry_interval=getattr(settings, "SIGEX_MAX_RETRY_INTERVAL", 60),
     )
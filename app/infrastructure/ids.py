@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from app.domain.entities import new_id
+from app.domain.ports import IdGenerator
+
+
+class UUID7IdGenerator(IdGenerator):
+    """Time-ordered UUIDv7 ids, the same format the entities default to."""
+
+    def new_id(self) -> str:
+        return new_id()
@@ -0,0 +1,147 @@
+"""Read-through cache in front of the document repository, and the small
+in-process caches it is built on."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+from app.domain.entities import Document
+from app.domain.ports import DocumentRepository
+
+
+class LRUCache:
+    """Thread-safe, size-bounded least-recently-used mapping."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries also expire ``ttl`` seconds after being set."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = super().get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self.pop(key)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        super().set(key, (time.monotonic() + self.ttl, value))
+
+
+# Shared by every repository instance in the process. The TTL is short so
+# that writes made by other workers become visible quickly; writes made
+# through this process invalidate their entry immediately.
+_document_cache = TTLCache(maxsize=10_000, ttl=2.0)
+
+
+class CachedDocumentRepository(DocumentRepository):
+    """Serves repeated ``get_for_read`` calls (e.g. status polling) from
+    memory."""
+
+    def __init__(self, inner: DocumentRepository, cache: TTLCache = _document_cache):
+        self.inner = inner
+        self.cache = cache
+
+    def save(self, document: Document) -> Document:
+        saved = self.inner.save(document)
+        self.cache.pop(document.id)
+        return saved
+
+    def get_by_id(self, document_id: str) -> Optional[Document]:
+        # Not cached: the result may be written back with update(), and a
+        # stale copy would undo another worker's changes.
+        return self.inner.get_by_id(document_id)
+
+    def get_for_read(self, document_id: str) -> Optional[Document]:
+        cached = self.cache.get(document_id)
+        if cached is None:
+            cached = self.inner.get_by_id(document_id)
+            if cached is None:
+                return None
+            self.cache.set(document_id, cached)
+        # Use cases mutate the entity they get back; hand out a copy.
+        return dataclasses.replace(cached)
+
+    def get_many(self, document_ids: Iterable[str]) -> dict[str, Document]:
+        return self.inner.get_many(document_ids)
+
+    def list_by_owner(self, owner_id: int) -> list[Document]:
+        return self.inner.list_by_owner(owner_id)
+
+    def list_by_owner_with_package_titles(
+        self, owner_id: int
+    ) -> list[tuple[Document, Optional[str]]]:
+        return self.inner.list_by_owner_with_package_titles(owner_id)
+
+    def list_by_package(self, owner_id: int, package_id: str) -> list[Document]:
+        return self.inner.list_by_package(owner_id, package_id)
+
+    def list_available_for_package(self, owner_id: int) -> list[Document]:
+        return self.inner.list_available_for_package(owner_id)
+
+    def list_without_package(self, owner_id: int) -> list[Document]:
+        return self.inner.list_without_package(owner_id)
+
+    def update(self, document: Document) -> Document:
+        updated = self.inner.update(document)
+        self.cache.pop(document.id)
+        return updated
+
+    def update_many(self, documents: Iterable[Document]) -> None:
+        documents = list(documents)
+        self.inner.update_many(documents)
+        for document in documents:
+            self.cache.pop(document.id)
+
+    def attach_to_package(self, document_ids: Iterable[str], package_id: str) -> int:
+        document_ids = list(document_ids)
+        count = self.inner.attach_to_package(document_ids, package_id)
+        for document_id in document_ids:
+            self.cache.pop(document_id)
+        return count
+
+    def delete(self, document_id: str) -> None:
+        self.inner.delete(document_id)
+        self.cache.pop(document_id)
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 05:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('persistence', '0004_add_signature_file_path'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='documentmodel',
+            index=models.Index(fields=['owner', '-created_at'], name='document_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='documentmodel',
+            index=models.Index(fields=['owner', 'status'], name='document_owner_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='packagemodel',
+            index=models.Index(fields=['owner', '-created_at'], name='package_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='signaturemodel',
+            index=models.Index(fields=['document', '-created_at'], name='signature_doc_created_idx'),
+        ),
+    ]
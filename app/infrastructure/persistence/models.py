@@ -66,6 +66,10 @@ class DocumentModel(models.Model):
     class Meta:
         app_label = "persistence"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["owner", "-created_at"], name="document_owner_created_idx"),
+            models.Index(fields=["owner", "status"], name="document_owner_status_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -103,6 +107,9 @@ class SignatureModel(models.Model):
     class Meta:
         app_label = "persistence"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["document", "-created_at"], name="signature_doc_created_idx"),
+        ]
 
     def __str__(self):
         return f"Signature by {self.signer_name} on {self.document.title}"
@@ -132,6 +139,9 @@ class PackageModel(models.Model):
     class Meta:
         app_label = "persistence"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["owner", "-created_at"], name="package_owner_created_idx"),
+        ]
 
     def __str__(self):
         return self.title
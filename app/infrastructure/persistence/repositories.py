@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Optional
+from typing import Iterable, Optional
 
 from app.domain.entities import (
     Document,
@@ -12,7 +12,11 @@ from app.domain.entities import (
     SignatureStatus,
     SignerType,
 )
-from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User, UserManager
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
 
 from app.domain.ports import (
     DocumentRepository,
@@ -28,6 +32,52 @@ from app.infrastructure.persistence.models import (
 )
 
 
+# Rows fetched per round trip when streaming list results.
+_ITERATOR_CHUNK_SIZE = 2000
+
+# Stored value -> enum member; a plain dict lookup is cheaper than calling
+# the enum once per row.
+_DOCUMENT_STATUS = {s.value: s for s in DocumentStatus}
+_SIGNATURE_STATUS = {s.value: s for s in SignatureStatus}
+_PACKAGE_STATUS = {s.value: s for s in PackageStatus}
+_SIGNER_TYPE = {t.value: t for t in SignerType}
+
+# Column order shared by the values_list() queries and _row_to_entity.
+_DOCUMENT_FIELDS = (
+    "id",
+    "title",
+    "filename",
+    "mime_type",
+    "file_size",
+    "file_path",
+    "sha256",
+    "status",
+    "sigex_document_id",
+    "signed_file_path",
+    "signature_file_path",
+    "error_message",
+    "owner_id",
+    "package_id",
+    "created_at",
+    "updated_at",
+)
+
+# signature_data (the base64 CMS blob) is left out: listings never read it.
+_SIGNATURE_FIELDS = (
+    "id",
+    "document_id",
+    "signer_iin",
+    "signer_name",
+    "signer_type",
+    "signer_bin",
+    "signer_company",
+    "sigex_sign_id",
+    "status",
+    "signed_at",
+    "created_at",
+)
+
+
 class DjangoDocumentRepository(DocumentRepository):
     @staticmethod
     def _to_entity(model: DocumentModel) -> Document:
@@ -39,7 +89,7 @@ class DjangoDocumentRepository(DocumentRepository):
             file_size=model.file_size,
             file_path=model.file_path,
             sha256=model.sha256,
-            status=DocumentStatus(model.status),
+            status=_DOCUMENT_STATUS[model.status],
             sigex_document_id=model.sigex_document_id,
             signed_file_path=model.signed_file_path,
             signature_file_path=model.signature_file_path,
@@ -50,8 +100,37 @@ class DjangoDocumentRepository(DocumentRepository):
             updated_at=model.updated_at,
         )
 
-    def save(self, document: Document) -> Document:
-        model = DocumentModel(
+    @staticmethod
+    def _row_to_entity(row: tuple) -> Document:
+        """Build an entity from a _DOCUMENT_FIELDS values_list() row,
+        skipping model instantiation."""
+        (
+            id_, title, filename, mime_type, file_size, file_path, sha256,
+            status, sigex_document_id, signed_file_path, signature_file_path,
+            error_message, owner_id, package_id, created_at, updated_at,
+        ) = row
+        return Document(
+            id=str(id_),
+            title=title,
+            filename=filename,
+            mime_type=mime_type,
+            file_size=file_size,
+            file_path=file_path,
+            sha256=sha256,
+            status=_DOCUMENT_STATUS[status],
+            sigex_document_id=sigex_document_id,
+            signed_file_path=signed_file_path,
+            signature_file_path=signature_file_path,
+            error_message=error_message,
+            owner_id=owner_id,
+            package_id=str(package_id) if package_id else None,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+
+    @staticmethod
+    def _to_model(document: Document) -> DocumentModel:
+        return DocumentModel(
             id=uuid.UUID(document.id),
             title=document.title,
             filename=document.filename,
@@ -67,6 +146,9 @@ class DjangoDocumentRepository(DocumentRepository):
             owner_id=document.owner_id,
             package_id=uuid.UUID(document.package_id) if document.package_id else None,
         )
+
+    def save(self, document: Document) -> Document:
+        model = self._to_model(document)
         model.save()
         return self._to_entity(model)
 
@@ -77,12 +159,53 @@ class DjangoDocumentRepository(DocumentRepository):
         except DocumentModel.DoesNotExist:
             return None
 
+    def get_many(self, document_ids: Iterable[str]) -> dict[str, Document]:
+        models = DocumentModel.objects.filter(
+            id__in=[uuid.UUID(d) for d in document_ids]
+        )
+        return {str(m.id): self._to_entity(m) for m in models}
+
     def list_by_owner(self, owner_id: int) -> list[Document]:
-        models = DocumentModel.objects.filter(owner_id=owner_id)
-        return [self._to_entity(m) for m in models]
+        rows = (
+            DocumentModel.objects.filter(owner_id=owner_id)
+            .values_list(*_DOCUMENT_FIELDS)
+            .iterator(chunk_size=_ITERATOR_CHUNK_SIZE)
+        )
+        return [self._row_to_entity(row) for row in rows]
+
+    def list_by_owner_with_package_titles(
+        self, owner_id: int
+    ) -> list[tuple[Document, Optional[str]]]:
+        rows = (
+            DocumentModel.objects.filter(owner_id=owner_id)
+            .values_list(*_DOCUMENT_FIELDS, "package__title")
+            .iterator(chunk_size=_ITERATOR_CHUNK_SIZE)
+        )
+        return [(self._row_to_entity(row[:-1]), row[-1]) for row in rows]
+
+    def list_by_package(self, owner_id: int, package_id: str) -> list[Document]:
+        rows = DocumentModel.objects.filter(
+            owner_id=owner_id, package_id=uuid.UUID(package_id)
+        ).values_list(*_DOCUMENT_FIELDS)
+        return [self._row_to_entity(row) for row in rows]
+
+    def list_available_for_package(self, owner_id: int) -> list[Document]:
+        rows = (
+            DocumentModel.objects.filter(owner_id=owner_id, package__isnull=True)
+            .exclude(status=DocumentStatus.SIGNED.value)
+            .values_list(*_DOCUMENT_FIELDS)
+        )
+        return [self._row_to_entity(row) for row in rows]
+
+    def list_without_package(self, owner_id: int) -> list[Document]:
+        rows = DocumentModel.objects.filter(
+            owner_id=owner_id, package__isnull=True
+        ).values_list(*_DOCUMENT_FIELDS)
+        return [self._row_to_entity(row) for row in rows]
 
     def update(self, document: Document) -> Document:
-        DocumentModel.objects.filter(id=uuid.UUID(document.id)).update(
+        now = timezone.now()
+        updated = DocumentModel.objects.filter(id=uuid.UUID(document.id)).update(
             title=document.title,
             filename=document.filename,
             mime_type=document.mime_type,
@@ -95,8 +218,45 @@ class DjangoDocumentRepository(DocumentRepository):
             signature_file_path=document.signature_file_path,
             error_message=document.error_message,
             package_id=uuid.UUID(document.package_id) if document.package_id else None,
+            updated_at=now,
+        )
+        if not updated:
+            # Deleted concurrently; report what the database has.
+            return self.get_by_id(document.id)
+        document.updated_at = now
+        return document
+
+    def update_many(self, documents: Iterable[Document]) -> None:
+        models = []
+        for document in documents:
+            model = self._to_model(document)
+            # bulk_update does not apply auto_now; keep the time the entity
+            # was changed at (mark_* set it).
+            model.updated_at = document.updated_at
+            models.append(model)
+        DocumentModel.objects.bulk_update(
+            models,
+            fields=[
+                "title",
+                "filename",
+                "mime_type",
+                "file_size",
+                "file_path",
+                "sha256",
+                "status",
+                "sigex_document_id",
+                "signed_file_path",
+                "signature_file_path",
+                "error_message",
+                "package_id",
+                "updated_at",
+            ],
         )
-        return self.get_by_id(document.id)
+
+    def attach_to_package(self, document_ids: Iterable[str], package_id: str) -> int:
+        return DocumentModel.objects.filter(
+            id__in=[uuid.UUID(d) for d in document_ids]
+        ).update(package_id=uuid.UUID(package_id), updated_at=timezone.now())
 
     def delete(self, document_id: str) -> None:
         DocumentModel.objects.filter(id=uuid.UUID(document_id)).delete()
@@ -110,16 +270,38 @@ class DjangoSignatureRepository(SignatureRepository):
             document_id=str(model.document_id),
             signer_iin=model.signer_iin,
             signer_name=model.signer_name,
-            signer_type=SignerType(model.signer_type),
+            signer_type=_SIGNER_TYPE[model.signer_type],
             signer_bin=model.signer_bin,
             signer_company=model.signer_company,
             signature_data=model.signature_data,
             sigex_sign_id=model.sigex_sign_id,
-            status=SignatureStatus(model.status),
+            status=_SIGNATURE_STATUS[model.status],
             signed_at=model.signed_at,
             created_at=model.created_at,
         )
 
+    @staticmethod
+    def _row_to_entity(row: tuple) -> Signature:
+        """Build an entity, without signature_data, from a _SIGNATURE_FIELDS
+        values_list() row."""
+        (
+            id_, document_id, signer_iin, signer_name, signer_type, signer_bin,
+            signer_company, sigex_sign_id, status, signed_at, created_at,
+        ) = row
+        return Signature(
+            id=str(id_),
+            document_id=str(document_id),
+            signer_iin=signer_iin,
+            signer_name=signer_name,
+            signer_type=_SIGNER_TYPE[signer_type],
+            signer_bin=signer_bin,
+            signer_company=signer_company,
+            sigex_sign_id=sigex_sign_id,
+            status=_SIGNATURE_STATUS[status],
+            signed_at=signed_at,
+            created_at=created_at,
+        )
+
     def save(self, signature: Signature) -> Signature:
         model = SignatureModel(
             id=uuid.UUID(signature.id),
@@ -145,30 +327,43 @@ class DjangoSignatureRepository(SignatureRepository):
             return None
 
     def list_by_document(self, document_id: str) -> list[Signature]:
-        models = SignatureModel.objects.filter(document_id=uuid.UUID(document_id))
-        return [self._to_entity(m) for m in models]
+        rows = (
+            SignatureModel.objects.filter(document_id=uuid.UUID(document_id))
+            .values_list(*_SIGNATURE_FIELDS)
+            .iterator(chunk_size=_ITERATOR_CHUNK_SIZE)
+        )
+        return [self._row_to_entity(row) for row in rows]
 
     def update(self, signature: Signature) -> Signature:
-        SignatureModel.objects.filter(id=uuid.UUID(signature.id)).update(
+        updated = SignatureModel.objects.filter(id=uuid.UUID(signature.id)).update(
             signature_data=signature.signature_data,
             sigex_sign_id=signature.sigex_sign_id,
             status=signature.status.value,
             signed_at=signature.signed_at,
         )
-        return self.get_by_id(signature.id)
+        if not updated:
+            return self.get_by_id(signature.id)
+        return signature
+
+
+# Loads the document ids of many packages in one extra query. package_id is
+# needed to attach each row to its package without a deferred-field fetch.
+_PACKAGE_DOCUMENTS = Prefetch(
+    "documents", queryset=DocumentModel.objects.only("id", "package_id")
+)
 
 
 class DjangoPackageRepository(PackageRepository):
     @staticmethod
     def _to_entity(model: PackageModel) -> Package:
-        doc_ids = list(
-            model.documents.values_list("id", flat=True)
-        )
+        # Served from the prefetch cache when the query used
+        # _PACKAGE_DOCUMENTS; otherwise this is one query per package.
+        doc_ids = [d.id for d in model.documents.all()]
         return Package(
             id=str(model.id),
             title=model.title,
             description=model.description,
-            status=PackageStatus(model.status),
+            status=_PACKAGE_STATUS[model.status],
             owner_id=model.owner_id,
             document_ids=[str(d) for d in doc_ids],
             created_at=model.created_at,
@@ -188,22 +383,47 @@ class DjangoPackageRepository(PackageRepository):
 
     def get_by_id(self, package_id: str) -> Optional[Package]:
         try:
-            model = PackageModel.objects.get(id=uuid.UUID(package_id))
+            model = PackageModel.objects.prefetch_related(_PACKAGE_DOCUMENTS).get(
+                id=uuid.UUID(package_id)
+            )
             return self._to_entity(model)
         except PackageModel.DoesNotExist:
             return None
 
     def list_by_owner(self, owner_id: int) -> list[Package]:
-        models = PackageModel.objects.filter(owner_id=owner_id)
+        models = PackageModel.objects.filter(owner_id=owner_id).prefetch_related(
+            _PACKAGE_DOCUMENTS
+        )
         return [self._to_entity(m) for m in models]
 
+    def list_by_owner_with_documents(
+        self, owner_id: int
+    ) -> list[tuple[Package, list[Document]]]:
+        # Full document rows this time; _to_entity reads its ids from the
+        # same prefetch cache.
+        models = PackageModel.objects.filter(owner_id=owner_id).prefetch_related(
+            "documents"
+        )
+        return [
+            (
+                self._to_entity(m),
+                [DjangoDocumentRepository._to_entity(d) for d in m.documents.all()],
+            )
+            for m in models
+        ]
+
     def update(self, package: Package) -> Package:
-        PackageModel.objects.filter(id=uuid.UUID(package.id)).update(
+        now = timezone.now()
+        updated = PackageModel.objects.filter(id=uuid.UUID(package.id)).update(
             title=package.title,
             description=package.description,
             status=package.status.value,
+            updated_at=now,
         )
-        return self.get_by_id(package.id)
+        if not updated:
+            return self.get_by_id(package.id)
+        package.updated_at = now
+        return package
 
     def delete(self, package_id: str) -> None:
         PackageModel.objects.filter(id=uuid.UUID(package_id)).delete()
@@ -224,17 +444,22 @@ class DjangoUserRepository(UserRepository):
         bin: str = "",
         company_name: str = "",
     ) -> int:
-        user = User.objects.create_user(
-            username=username,
-            password=password,
-            email=email,
-        )
-        UserProfile.objects.create(
-            user=user,
-            iin=iin,
-            full_name=full_name,
-            signer_type=signer_type,
-            bin=bin,
-            company_name=company_name,
+        # Hash first: password hashing is deliberately slow and should not
+        # run inside the transaction.
+        user = User(
+            username=User.normalize_username(username),
+            email=UserManager.normalize_email(email),
+            password=make_password(password),
         )
+        # Both rows or neither: a user without a profile cannot sign.
+        with transaction.atomic():
+            user.save(force_insert=True)
+            UserProfile(
+                user=user,
+                iin=iin,
+                full_name=full_name,
+                signer_type=signer_type,
+                bin=bin,
+                company_name=company_name,
+            ).save(force_insert=True)
         return user.id
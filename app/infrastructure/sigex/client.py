@@ -11,11 +11,17 @@ document registration / signature management API.
 from __future__ import annotations
 
 import base64
+import json
 import logging
+import random
+import socket
 import time
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from app.domain.entities import QRSigningSession
 from app.domain.exceptions import (
@@ -28,6 +34,154 @@ from app.domain.ports import SigningService
 
 logger = logging.getLogger(__name__)
 
+# Raw bytes encoded per step when streaming a signing payload; a multiple of
+# 3 so every chunk encodes to unpadded base64 except the last.
+_B64_CHUNK_SIZE = 3 * 256 * 1024
+
+# Signing poll delays start short and grow by this factor up to
+# poll_interval: most users confirm within seconds, so early polls matter most.
+_POLL_FIRST_DELAY = 0.5
+_POLL_BACKOFF = 1.5
+
+# First wait after a failed attempt to send signing data; doubles with each
+# consecutive failure (see SigexClient._retry_delay). Timeouts of the long
+# poll are not failures and are retried without waiting.
+_SEND_RETRY_DELAY = 1.0
+
+_OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
+# Connections kept open per host. Package signing and the upload executor
+# run up to 32 Sigex calls each at once; the requests default of 10 would
+# close and reopen TLS connections under that load.
+_POOL_MAXSIZE = 64
+
+# Only failures to connect are retried at this level: nothing was sent, so
+# it is safe for POSTs too. Read errors and 5xx responses are handled by the
+# callers, since repeating e.g. register_document could create a duplicate.
+_CONNECT_RETRY = Retry(
+    total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.3
+)
+
+
+# TCP keepalive probes on pooled connections, so that one dropped by a
+# middlebox while the user is scanning the QR code is noticed and replaced
+# instead of failing the next request. The tuning options are Linux-only.
+_KEEPALIVE_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *(
+        (socket.IPPROTO_TCP, getattr(socket, name), value)
+        for name, value in (
+            ("TCP_KEEPIDLE", 60),
+            ("TCP_KEEPINTVL", 30),
+            ("TCP_KEEPCNT", 3),
+        )
+        if hasattr(socket, name)
+    ),
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _KEEPALIVE_SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _SigningPayload:
+    """
+    File-like JSON body for the QR data endpoint.
+
+    Documents given as raw bytes are base64-encoded chunk by chunk while the
+    body is being sent, so the encoded copy of a file never exists in full.
+    The total length is known up front, so requests sends a plain
+    Content-Length body rather than a chunked one.
+    """
+
+    def __init__(self, parts: list[Union[bytes, memoryview]]):
+        # bytes parts are JSON literals; memoryview parts are raw file data.
+        self._parts = parts
+        self._len = sum(
+            4 * ((len(p) + 2) // 3) if isinstance(p, memoryview) else len(p)
+            for p in parts
+        )
+        self._chunks = self._iter_chunks()
+        self._buffer = b""
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for part in self._parts:
+            if not isinstance(part, memoryview):
+                yield part
+                continue
+            for start in range(0, len(part), _B64_CHUNK_SIZE):
+                yield base64.b64encode(part[start:start + _B64_CHUNK_SIZE])
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer[self._pos:] + b"".join(self._chunks)
+            self._buffer, self._pos = b"", 0
+            return data
+        pieces = []
+        while size > 0:
+            if self._pos >= len(self._buffer):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer, self._pos = chunk, 0
+            piece = self._buffer[self._pos:self._pos + size]
+            self._pos += len(piece)
+            size -= len(piece)
+            pieces.append(piece)
+        return b"".join(pieces)
+
+    @classmethod
+    def build(
+        cls, sign_method: str, documents_to_sign: list[dict]
+    ) -> "_SigningPayload":
+        parts: list[Union[bytes, memoryview]] = [
+            b'{"signMethod": ' + json.dumps(sign_method).encode()
+            + b', "documentsToSign": ['
+        ]
+        for i, doc in enumerate(documents_to_sign):
+            if i:
+                parts.append(b", ")
+            file = doc["document"]["file"]
+            data = file["data"]
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                parts.append(json.dumps(doc).encode())
+                continue
+            # "data" is the last key of the innermost object, so the entry
+            # serialised with an empty string ends in '""}}}'.
+            head = json.dumps({**doc, "document": {"file": {**file, "data": ""}}})
+            parts.append(head[:-4].encode())
+            parts.append(memoryview(data).cast("B"))
+            parts.append(b'"}}}')
+        parts.append(b"]}")
+        return cls(parts)
+
+
+class _SizedStream:
+    """
+    Binary stream of known length, exposing only read() and __len__.
+
+    requests sends anything iterable (e.g. an S3 StreamingBody) as a
+    chunked body. Without __iter__ it measures the body with len() and
+    frames it by Content-Length instead, as for _SigningPayload.
+    """
+
+    def __init__(self, stream: BinaryIO, size: int):
+        self._stream = stream
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
 
 class SigexClient(SigningService):
     def __init__(
@@ -36,32 +190,71 @@ class SigexClient(SigningService):
         timeout: int = 30,
         poll_retries: int = 60,
         poll_interval: int = 3,
+        max_retry_interval: int = 60,
     ):
+        """
+        poll_interval caps the wait between polls while a signature is
+        pending. After failed requests the wait backs off exponentially,
+        up to max_retry_interval, so a struggling Sigex is not hit at a
+        constant rate.
+        """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.poll_retries = poll_retries
         self.poll_interval = poll_interval
+        self.max_retry_interval = max_retry_interval
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
+        adapter = _KeepAliveAdapter(
+            pool_maxsize=_POOL_MAXSIZE, max_retries=_CONNECT_RETRY
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    # ── eGov QR Signing (standalone, no pre-registration) ────────────
+    def _retry_delay(self, base: float, errors: int) -> float:
+        """Truncated exponential backoff with jitter, after the given number
+        of consecutive failures (counting from 0)."""
+        delay = min(self.max_retry_interval, base * 2 ** errors)
+        return delay + random.uniform(0, delay / 2)
 
-    def register_qr_signing(self, description: str) -> QRSigningSession:
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        ok_key: Optional[str] = None,
+        check_message: bool = True,
+        error: type[Exception] = SigningError,
+        **kwargs,
+    ) -> dict:
         """
-        Register a new QR signing procedure.
-        Maps to: POST /api/egovQr
+        Call a Sigex API endpoint and return its decoded JSON body.
+
+        Sigex reports failures as a body with a "message". Unless
+        check_message is off, such a body raises `error`, except when it also
+        carries ok_key (some successful replies include a message too).
         """
-        response = self.session.post(
-            f"{self.base_url}/api/egovQr",
-            json={"description": description},
-            timeout=self.timeout,
+        response = self.session.request(
+            method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs
         )
         response.raise_for_status()
         data = response.json()
+        if check_message and "message" in data and (
+            ok_key is None or ok_key not in data
+        ):
+            raise error(data["message"])
+        return data
 
-        if "message" in data:
-            raise SigningError(data["message"])
+    # ── eGov QR Signing (standalone, no pre-registration) ────────────
 
+    def register_qr_signing(self, description: str) -> QRSigningSession:
+        """
+        Register a new QR signing procedure.
+        Maps to: POST /api/egovQr
+        """
+        data = self._request(
+            "POST", "/api/egovQr", json={"description": description}
+        )
         return QRSigningSession(
             qr_code_base64=data.get("qrCode", ""),
             data_url=data.get("dataURL", ""),
@@ -85,7 +278,8 @@ class SigexClient(SigningService):
             - nameRu: str
             - nameKz: str (optional, defaults to nameRu)
             - nameEn: str (optional, defaults to nameRu)
-            - data: base64 string of file content
+            - data: base64 string of file content, or the raw bytes, which
+              are then base64-encoded while the request body is streamed
             - meta: list of {"name": str, "value": str} (optional)
             - isPDF: bool (optional)
         """
@@ -107,17 +301,32 @@ class SigexClient(SigningService):
 
         sign_method = "CMS_WITH_DATA" if attach_data else "CMS_SIGN_ONLY"
 
+        stream = any(
+            isinstance(doc["document"]["file"]["data"], (bytes, bytearray, memoryview))
+            for doc in documents_to_sign
+        )
+
         last_error = None
+        errors = 0
         for attempt in range(self.poll_retries):
             try:
-                response = self.session.post(
-                    session.data_url,
-                    json={
-                        "signMethod": sign_method,
-                        "documentsToSign": documents_to_sign,
-                    },
-                    timeout=self.timeout,
-                )
+                if stream:
+                    # A streamed body is consumed by the attempt; build a
+                    # fresh one each time.
+                    response = self.session.post(
+                        session.data_url,
+                        data=_SigningPayload.build(sign_method, documents_to_sign),
+                        timeout=self.timeout,
+                    )
+                else:
+                    response = self.session.post(
+                        session.data_url,
+                        json={
+                            "signMethod": sign_method,
+                            "documentsToSign": documents_to_sign,
+                        },
+                        timeout=self.timeout,
+                    )
                 response.raise_for_status()
                 data = response.json()
                 if "message" in data:
@@ -125,6 +334,17 @@ class SigexClient(SigningService):
                 return
             except SigningError:
                 raise
+            except requests.ReadTimeout as e:
+                # The data URL is a long poll: it answers once the QR code
+                # is scanned, so a timeout only means the user has not
+                # scanned it yet. Re-post at once so no scan is missed.
+                last_error = e
+                errors = 0
+                logger.debug(
+                    "Attempt %d/%d to send data timed out",
+                    attempt + 1,
+                    self.poll_retries,
+                )
             except requests.RequestException as e:
                 last_error = e
                 logger.debug(
@@ -134,7 +354,8 @@ class SigexClient(SigningService):
                     e,
                 )
                 if attempt < self.poll_retries - 1:
-                    time.sleep(1)
+                    time.sleep(self._retry_delay(_SEND_RETRY_DELAY, errors))
+                errors += 1
 
         raise SigningError(
             f"Failed to send data after {self.poll_retries} attempts: {last_error}"
@@ -147,7 +368,12 @@ class SigexClient(SigningService):
         Returns list of base64 CMS signatures.
         """
         last_error = None
+        pending_delay = _POLL_FIRST_DELAY
+        errors = 0
+        wait = 0.0
         for attempt in range(self.poll_retries):
+            if attempt:
+                time.sleep(wait)
             try:
                 response = self.session.get(
                     session.sign_url,
@@ -162,7 +388,9 @@ class SigexClient(SigningService):
                         raise SigningCancelledError(msg)
                     # Not ready yet, keep polling
                     logger.debug("Polling attempt %d: %s", attempt + 1, msg)
-                    time.sleep(self.poll_interval)
+                    errors = 0
+                    wait = min(pending_delay, self.poll_interval)
+                    pending_delay *= _POLL_BACKOFF
                     continue
 
                 signatures = [
@@ -181,7 +409,8 @@ class SigexClient(SigningService):
                     self.poll_retries,
                     e,
                 )
-                time.sleep(self.poll_interval)
+                wait = self._retry_delay(self.poll_interval, errors)
+                errors += 1
 
         raise SigningTimeoutError(
             f"Signing timed out after {self.poll_retries} attempts: {last_error}"
@@ -207,37 +436,37 @@ class SigexClient(SigningService):
         if signature:
             payload["signature"] = signature
 
-        response = self.session.post(
-            f"{self.base_url}/api",
-            json=payload,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        if "message" in data and "documentId" not in data:
-            raise SigningError(data["message"])
-
+        data = self._request("POST", "/api", ok_key="documentId", json=payload)
         return data["documentId"]
 
-    def upload_document_data(self, sigex_document_id: str, data: bytes) -> dict:
+    @staticmethod
+    def _octet_stream_body(
+        data: Union[bytes, BinaryIO], size: Optional[int]
+    ) -> Union[bytes, BinaryIO, _SizedStream]:
+        # Without a known length requests falls back to a chunked body for
+        # streams it cannot measure.
+        if size is None or isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        return _SizedStream(data, size)
+
+    def upload_document_data(
+        self,
+        sigex_document_id: str,
+        data: Union[bytes, BinaryIO],
+        size: Optional[int] = None,
+    ) -> dict:
         """
         Upload document binary data.
         Maps to: POST /api/{id}/data
         Returns dict with digests.
         """
-        response = self.session.post(
-            f"{self.base_url}/api/{sigex_document_id}/data",
-            data=data,
-            headers={"Content-Type": "application/octet-stream"},
-            timeout=self.timeout,
+        result = self._request(
+            "POST",
+            f"/api/{sigex_document_id}/data",
+            ok_key="documentId",
+            data=self._octet_stream_body(data, size),
+            headers=_OCTET_STREAM_HEADERS,
         )
-        response.raise_for_status()
-        result = response.json()
-
-        if "message" in result and "documentId" not in result:
-            raise SigningError(result["message"])
-
         return result.get("digests", {})
 
     def add_signature(self, sigex_document_id: str, signature_b64: str) -> int:
@@ -245,38 +474,36 @@ class SigexClient(SigningService):
         Add a CMS signature to a registered document.
         Maps to: POST /api/{id}
         """
-        response = self.session.post(
-            f"{self.base_url}/api/{sigex_document_id}",
+        data = self._request(
+            "POST",
+            f"/api/{sigex_document_id}",
+            ok_key="signId",
             json={
                 "signType": "cms",
                 "signature": signature_b64,
             },
-            timeout=self.timeout,
         )
-        response.raise_for_status()
-        data = response.json()
-
-        if "message" in data and "signId" not in data:
-            raise SigningError(data["message"])
-
         return data.get("signId", 0)
 
-    def verify_document(self, sigex_document_id: str, data: bytes) -> bool:
+    def verify_document(
+        self,
+        sigex_document_id: str,
+        data: Union[bytes, BinaryIO],
+        size: Optional[int] = None,
+    ) -> bool:
         """
         Verify document signatures.
         Maps to: POST /api/{id}/verify
         """
         try:
-            response = self.session.post(
-                f"{self.base_url}/api/{sigex_document_id}/verify",
-                data=data,
-                headers={"Content-Type": "application/octet-stream"},
-                timeout=self.timeout,
+            self._request(
+                "POST",
+                f"/api/{sigex_document_id}/verify",
+                ok_key="documentId",
+                error=VerificationError,
+                data=self._octet_stream_body(data, size),
+                headers=_OCTET_STREAM_HEADERS,
             )
-            response.raise_for_status()
-            result = response.json()
-            if "message" in result and "documentId" not in result:
-                raise VerificationError(result["message"])
             return True
         except (requests.RequestException, VerificationError) as e:
             raise VerificationError(f"Verification failed: {e}")
@@ -286,17 +513,7 @@ class SigexClient(SigningService):
         Get document information including signatures.
         Maps to: GET /api/{id}
         """
-        response = self.session.get(
-            f"{self.base_url}/api/{sigex_document_id}",
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        if "message" in data and "title" not in data:
-            raise SigningError(data["message"])
-
-        return data
+        return self._request("GET", f"/api/{sigex_document_id}", ok_key="title")
 
     # ── Document-based eGov QR signing ───────────────────────────────
 
@@ -307,16 +524,9 @@ class SigexClient(SigningService):
         Register QR signing for an already-registered document.
         Maps to: POST /api/{id}/egovQr
         """
-        response = self.session.post(
-            f"{self.base_url}/api/{sigex_document_id}/egovQr",
-            json={"language": language},
-            timeout=self.timeout,
+        return self._request(
+            "POST", f"/api/{sigex_document_id}/egovQr", json={"language": language}
         )
-        response.raise_for_status()
-        data = response.json()
-        if "message" in data:
-            raise SigningError(data["message"])
-        return data
 
     def check_egov_operation(
         self, sigex_document_id: str, operation_id: str
@@ -325,12 +535,11 @@ class SigexClient(SigningService):
         Check eGov operation status.
         Maps to: GET /api/{id}/egovOperation/{operationId}
         """
-        response = self.session.get(
-            f"{self.base_url}/api/{sigex_document_id}/egovOperation/{operation_id}",
-            timeout=self.timeout,
+        return self._request(
+            "GET",
+            f"/api/{sigex_document_id}/egovOperation/{operation_id}",
+            check_message=False,
         )
-        response.raise_for_status()
-        return response.json()
 
     def cancel_egov_operation(
         self, sigex_document_id: str, operation_id: str
@@ -352,9 +561,8 @@ class SigexClient(SigningService):
         Export a specific signature.
         Maps to: GET /api/{id}/signature/{signId}
         """
-        response = self.session.get(
-            f"{self.base_url}/api/{sigex_document_id}/signature/{sign_id}",
-            timeout=self.timeout,
+        return self._request(
+            "GET",
+            f"/api/{sigex_document_id}/signature/{sign_id}",
+            check_message=False,
         )
-        response.raise_for_status()
-        return response.json()
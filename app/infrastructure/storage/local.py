@@ -1,22 +1,35 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 from django.conf import settings
 
 from app.domain.exceptions import FileStorageError
-from app.domain.ports import FileStorage
+from app.domain.ports import FileStorage, StorageStat
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Suffix of the sidecar file holding a stored file's SHA-256.
+_DIGEST_SUFFIX = ".sha256"
 
 
 class LocalFileStorage(FileStorage):
     def __init__(self, base_dir: str | None = None):
         self.base_dir = Path(base_dir or settings.MEDIA_ROOT)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Resolved once; base_dir does not change after construction.
+        self._resolved_base = str(self.base_dir.resolve())
 
     def _full_path(self, file_path: str) -> Path:
+        # The child is still resolved, so symlinks cannot lead outside.
+        # commonpath compares whole components: a bare prefix check would
+        # let "<base>2/..." through.
         full = (self.base_dir / file_path).resolve()
-        if not str(full).startswith(str(self.base_dir.resolve())):
+        base = self._resolved_base
+        if os.path.commonpath((base, full)) != base:
             raise FileStorageError("Path traversal detected")
         return full
 
@@ -29,22 +42,102 @@ class LocalFileStorage(FileStorage):
             raise FileStorageError(f"Failed to save file: {e}")
         return file_path
 
+    def save_stream(self, file_path: str, src: BinaryIO) -> str:
+        full = self._full_path(file_path)
+        full.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with full.open("wb") as dst:
+                if hasattr(src, "readinto"):
+                    # One reusable buffer instead of a new bytes per chunk.
+                    buf = memoryview(bytearray(_COPY_CHUNK_SIZE))
+                    while n := src.readinto(buf):
+                        dst.write(buf[:n])
+                else:
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+        except OSError as e:
+            raise FileStorageError(f"Failed to save file: {e}")
+        return file_path
+
+    def link_file(self, src_path: str, dst_path: str) -> str:
+        src = self._full_path(src_path)
+        dst = self._full_path(dst_path)
+        if not src.exists():
+            raise FileStorageError(f"File not found: {src_path}")
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if dst.exists():
+                dst.unlink()
+            try:
+                os.link(src, dst)
+            except OSError:
+                # Hard links are not available across devices or on some
+                # filesystems; fall back to a kernel-side copy.
+                shutil.copyfile(src, dst)
+        except OSError as e:
+            raise FileStorageError(f"Failed to link file: {e}")
+        return dst_path
+
     def read_file(self, file_path: str) -> bytes:
         full = self._full_path(file_path)
-        if not full.exists():
-            raise FileStorageError(f"File not found: {file_path}")
+        # Opening directly instead of checking exists() first saves a stat.
         try:
             return full.read_bytes()
+        except FileNotFoundError:
+            raise FileStorageError(f"File not found: {file_path}")
         except OSError as e:
             raise FileStorageError(f"Failed to read file: {e}")
 
+    def open_stream(self, file_path: str) -> BinaryIO:
+        full = self._full_path(file_path)
+        try:
+            return full.open("rb")
+        except FileNotFoundError:
+            raise FileStorageError(f"File not found: {file_path}")
+        except OSError as e:
+            raise FileStorageError(f"Failed to open file: {e}")
+
+    def download_url(
+        self, file_path: str, filename: str, mime_type: str
+    ) -> Optional[str]:
+        return None
+
+    @staticmethod
+    def _digest_path(full: Path) -> Path:
+        return full.with_name(full.name + _DIGEST_SUFFIX)
+
+    def record_digest(self, file_path: str, sha256: str) -> None:
+        sidecar = self._digest_path(self._full_path(file_path))
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        try:
+            tmp.write_text(sha256)
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            raise FileStorageError(f"Failed to save digest: {e}")
+
+    def stat_with_digest(self, file_path: str) -> StorageStat:
+        full = self._full_path(file_path)
+        try:
+            st = full.stat()
+        except FileNotFoundError:
+            raise FileStorageError(f"File not found: {file_path}")
+        except OSError as e:
+            raise FileStorageError(f"Failed to stat file: {e}")
+        sidecar = self._digest_path(full)
+        try:
+            # A file modified after its digest was recorded is not trusted.
+            if sidecar.stat().st_mtime_ns >= st.st_mtime_ns:
+                return StorageStat(size=st.st_size, sha256=sidecar.read_text())
+        except OSError:
+            pass
+        return StorageStat(size=st.st_size)
+
     def delete_file(self, file_path: str) -> None:
         full = self._full_path(file_path)
-        if full.exists():
-            try:
-                full.unlink()
-            except OSError as e:
-                raise FileStorageError(f"Failed to delete file: {e}")
+        try:
+            full.unlink(missing_ok=True)
+            self._digest_path(full).unlink(missing_ok=True)
+        except OSError as e:
+            raise FileStorageError(f"Failed to delete file: {e}")
 
     def file_exists(self, file_path: str) -> bool:
         return self._full_path(file_path).exists()
@@ -1,21 +1,58 @@
 from __future__ import annotations
 
+import functools
+from typing import BinaryIO, Optional
+
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.utils.http import content_disposition_header
 
 from app.domain.exceptions import FileStorageError
-from app.domain.ports import FileStorage
+from app.domain.ports import FileStorage, StorageStat
+
+# Sized for package signing, which reads and writes from up to 32 threads.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+# Lifetime in seconds of the presigned URLs returned by download_url.
+_DOWNLOAD_URL_TTL = 300
+
+# Suffix of the sidecar object holding a stored file's SHA-256.
+_DIGEST_SUFFIX = ".sha256"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(
+    access_key: str,
+    secret_key: str,
+    endpoint_url: Optional[str],
+    region_name: Optional[str],
+):
+    # Building a client loads the service model, which takes tens of
+    # milliseconds; clients are thread-safe, so one is shared per setup.
+    return boto3.client(
+        "s3",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        endpoint_url=endpoint_url,
+        region_name=region_name,
+        config=_CLIENT_CONFIG,
+    )
 
 
 class S3FileStorage(FileStorage):
     def __init__(self):
-        self.client = boto3.client(
-            "s3",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
-            region_name=settings.AWS_S3_REGION_NAME or None,
+        self.client = _get_client(
+            settings.AWS_ACCESS_KEY_ID,
+            settings.AWS_SECRET_ACCESS_KEY,
+            settings.AWS_S3_ENDPOINT_URL or None,
+            settings.AWS_S3_REGION_NAME or None,
         )
         self.bucket = settings.AWS_STORAGE_BUCKET_NAME
 
@@ -26,6 +63,27 @@ class S3FileStorage(FileStorage):
             raise FileStorageError(f"S3 upload failed: {e}")
         return file_path
 
+    def save_stream(self, file_path: str, src: BinaryIO) -> str:
+        try:
+            # Managed transfer: multipart with parallel parts above 8 MiB.
+            self.client.upload_fileobj(src, self.bucket, file_path)
+        except (ClientError, S3UploadFailedError) as e:
+            raise FileStorageError(f"S3 upload failed: {e}")
+        return file_path
+
+    def link_file(self, src_path: str, dst_path: str) -> str:
+        try:
+            # Managed copy: a single CopyObject cannot exceed 5 GB, so large
+            # objects are copied server-side in parts.
+            self.client.copy(
+                CopySource={"Bucket": self.bucket, "Key": src_path},
+                Bucket=self.bucket,
+                Key=dst_path,
+            )
+        except (ClientError, S3UploadFailedError) as e:
+            raise FileStorageError(f"S3 copy failed: {e}")
+        return dst_path
+
     def read_file(self, file_path: str) -> bytes:
         try:
             response = self.client.get_object(Bucket=self.bucket, Key=file_path)
@@ -33,9 +91,71 @@ class S3FileStorage(FileStorage):
         except ClientError as e:
             raise FileStorageError(f"S3 read failed: {e}")
 
+    def open_stream(self, file_path: str) -> BinaryIO:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=file_path)
+            return response["Body"]
+        except ClientError as e:
+            raise FileStorageError(f"S3 read failed: {e}")
+
+    def download_url(
+        self, file_path: str, filename: str, mime_type: str
+    ) -> Optional[str]:
+        # Signed locally, no request to S3. Objects are stored without
+        # metadata, so the response headers are set through the URL.
+        try:
+            return self.client.generate_presigned_url(
+                "get_object",
+                Params={
+                    "Bucket": self.bucket,
+                    "Key": file_path,
+                    "ResponseContentType": mime_type,
+                    "ResponseContentDisposition": content_disposition_header(
+                        True, filename
+                    ),
+                },
+                ExpiresIn=_DOWNLOAD_URL_TTL,
+            )
+        except ClientError as e:
+            raise FileStorageError(f"S3 presign failed: {e}")
+
+    def record_digest(self, file_path: str, sha256: str) -> None:
+        # Kept in a small sidecar object: rewriting the data object's
+        # metadata would copy all of its bytes. The sidecar remembers the
+        # ETag it was computed for, so a later overwrite invalidates it.
+        try:
+            etag = self.client.head_object(Bucket=self.bucket, Key=file_path)["ETag"]
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=file_path + _DIGEST_SUFFIX,
+                Body=sha256.encode(),
+                Metadata={"source-etag": etag},
+            )
+        except ClientError as e:
+            raise FileStorageError(f"S3 digest save failed: {e}")
+
+    def stat_with_digest(self, file_path: str) -> StorageStat:
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=file_path)
+        except ClientError as e:
+            raise FileStorageError(f"S3 stat failed: {e}")
+        try:
+            sidecar = self.client.get_object(
+                Bucket=self.bucket, Key=file_path + _DIGEST_SUFFIX
+            )
+        except ClientError:
+            return StorageStat(size=head["ContentLength"])
+        sha256 = sidecar["Body"].read().decode()
+        if sidecar.get("Metadata", {}).get("source-etag") != head["ETag"]:
+            sha256 = None
+        return StorageStat(size=head["ContentLength"], sha256=sha256)
+
     def delete_file(self, file_path: str) -> None:
         try:
             self.client.delete_object(Bucket=self.bucket, Key=file_path)
+            self.client.delete_object(
+                Bucket=self.bucket, Key=file_path + _DIGEST_SUFFIX
+            )
         except ClientError as e:
             raise FileStorageError(f"S3 delete failed: {e}")
 
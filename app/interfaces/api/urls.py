@@ -1,5 +1,6 @@
 from django.urls import path
 
+from app.interfaces import converters  # noqa: F401  (registers uuid_str)
 from app.interfaces.api.views import (
     CompletePackageSigningView,
     CompleteSigningView,
@@ -38,32 +39,32 @@ urlpatterns = [
         name="document-upload-multiple",
     ),
     path(
-        "documents/<uuid:document_id>/",
+        "documents/<uuid_str:document_id>/",
         DocumentDetailView.as_view(),
         name="document-detail",
     ),
     path(
-        "documents/<uuid:document_id>/download/",
+        "documents/<uuid_str:document_id>/download/",
         DocumentDownloadView.as_view(),
         name="document-download",
     ),
     path(
-        "documents/<uuid:document_id>/download/original/",
+        "documents/<uuid_str:document_id>/download/original/",
         DocumentDownloadView.as_view(),
         name="document-download-original",
     ),
     path(
-        "documents/<uuid:document_id>/download/signature/",
+        "documents/<uuid_str:document_id>/download/signature/",
         DocumentDownloadSignatureView.as_view(),
         name="document-download-signature",
     ),
     path(
-        "documents/<uuid:document_id>/download-signed/",
+        "documents/<uuid_str:document_id>/download-signed/",
         DocumentDownloadSignedView.as_view(),
         name="document-download-signed",
     ),
     path(
-        "documents/<uuid:document_id>/verify/",
+        "documents/<uuid_str:document_id>/verify/",
         DocumentVerifyView.as_view(),
         name="document-verify",
     ),
@@ -85,12 +86,12 @@ urlpatterns = [
     path("packages/", PackageListView.as_view(), name="package-list"),
     path("packages/create/", PackageCreateView.as_view(), name="package-create"),
     path(
-        "packages/<uuid:package_id>/add-document/",
+        "packages/<uuid_str:package_id>/add-document/",
         PackageAddDocumentView.as_view(),
         name="package-add-document",
     ),
     path(
-        "packages/<uuid:package_id>/download-signed/",
+        "packages/<uuid_str:package_id>/download-signed/",
         PackageDownloadSignedView.as_view(),
         name="package-download-signed",
     ),
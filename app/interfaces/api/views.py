@@ -4,7 +4,14 @@ import logging
 
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
-from django.http import HttpResponse
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -43,6 +50,7 @@ from app.domain.exceptions import (
 from app.infrastructure.container import (
     get_document_repository,
     get_file_storage,
+    get_id_generator,
     get_package_repository,
     get_signature_repository,
     get_signing_service,
@@ -80,20 +88,27 @@ def _get_signer_identity(user: User) -> SignerIdentity:
     )
 
 
+# HTTP status per domain error. _error_response walks the exception's MRO,
+# so the most specific entry wins and new subclasses inherit their base's.
+_ERROR_STATUS = {
+    DocumentNotFoundError: status.HTTP_404_NOT_FOUND,
+    PackageNotFoundError: status.HTTP_404_NOT_FOUND,
+    AccessDeniedError: status.HTTP_403_FORBIDDEN,
+    InvalidDocumentError: status.HTTP_400_BAD_REQUEST,
+    VerificationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    SigningError: status.HTTP_400_BAD_REQUEST,
+    DomainError: status.HTTP_400_BAD_REQUEST,
+}
+
+
 def _error_response(exc: Exception) -> tuple[dict, int]:
     """Map domain exceptions to HTTP status codes."""
-    if isinstance(exc, (DocumentNotFoundError, PackageNotFoundError)):
-        return {"error": str(exc)}, status.HTTP_404_NOT_FOUND
-    if isinstance(exc, AccessDeniedError):
-        return {"error": str(exc)}, status.HTTP_403_FORBIDDEN
-    if isinstance(exc, InvalidDocumentError):
-        return {"error": str(exc)}, status.HTTP_400_BAD_REQUEST
-    if isinstance(exc, VerificationError):
-        return {"error": str(exc)}, status.HTTP_422_UNPROCESSABLE_ENTITY
-    if isinstance(exc, SigningError):
-        return {"status": "failed", "error": str(exc)}, status.HTTP_400_BAD_REQUEST
-    if isinstance(exc, DomainError):
-        return {"error": str(exc)}, status.HTTP_400_BAD_REQUEST
+    for cls in type(exc).__mro__:
+        code = _ERROR_STATUS.get(cls)
+        if code is not None:
+            if issubclass(cls, SigningError):
+                return {"status": "failed", "error": str(exc)}, code
+            return {"error": str(exc)}, code
     return {"error": "Internal server error"}, status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
@@ -183,9 +198,12 @@ class ProfileView(APIView):
 # ── Document Views ───────────────────────────────────────────────────
 
 
+# Listings grow with the account and compress well. Not applied globally:
+# file downloads are mostly already-compressed PDFs, images and ZIPs.
+@method_decorator(gzip_page, name="dispatch")
 class DocumentListView(APIView):
     def get(self, request):
-        use_case = ListDocumentsUseCase(get_document_repository(), get_package_repository())
+        use_case = ListDocumentsUseCase(get_document_repository())
         docs = use_case.execute(request.user.id)
         return Response(docs)
 
@@ -198,15 +216,14 @@ class DocumentUploadView(APIView):
         serializer.is_valid(raise_exception=True)
 
         uploaded_file = serializer.validated_data["file"]
-        file_data = uploaded_file.read()
 
         use_case = UploadDocumentUseCase(
-            get_document_repository(), get_file_storage()
+            get_document_repository(), get_file_storage(), get_id_generator()
         )
 
         try:
             result = use_case.execute(
-                file_data=file_data,
+                file_obj=uploaded_file,
                 filename=uploaded_file.name,
                 mime_type=uploaded_file.content_type,
                 title=serializer.validated_data["title"],
@@ -245,29 +262,26 @@ class MultiDocumentUploadView(APIView):
             )
 
         use_case = UploadDocumentUseCase(
-            get_document_repository(), get_file_storage()
+            get_document_repository(), get_file_storage(), get_id_generator()
         )
 
         results = []
-        for f in files:
-            try:
-                result = use_case.execute(
-                    file_data=f.read(),
-                    filename=f.name,
-                    mime_type=f.content_type,
-                    title=title or f.name,
-                    owner_id=request.user.id,
-                    package_id=str(package_id) if package_id else None,
-                )
-                results.append({
-                    "document_id": result.document_id,
-                    "title": result.title,
-                    "filename": result.filename,
-                    "sha256": result.sha256,
-                    "status": result.status,
-                })
-            except DomainError as e:
-                results.append({"filename": f.name, "error": str(e)})
+        outcomes = use_case.execute_many(
+            [(f, f.name, f.content_type, title or f.name) for f in files],
+            owner_id=request.user.id,
+            package_id=str(package_id) if package_id else None,
+        )
+        for f, result in zip(files, outcomes):
+            if isinstance(result, DomainError):
+                results.append({"filename": f.name, "error": str(result)})
+                continue
+            results.append({
+                "document_id": result.document_id,
+                "title": result.title,
+                "filename": result.filename,
+                "sha256": result.sha256,
+                "status": result.status,
+            })
 
         return Response({"documents": results}, status=status.HTTP_201_CREATED)
 
@@ -278,7 +292,7 @@ class DocumentDetailView(APIView):
             get_document_repository(), get_signature_repository()
         )
         try:
-            result = use_case.execute(str(document_id), request.user.id)
+            result = use_case.execute(document_id, request.user.id)
         except DomainError as e:
             body, code = _error_response(e)
             return Response(body, status=code)
@@ -286,7 +300,17 @@ class DocumentDetailView(APIView):
         return Response({
             "document_id": result.document_id,
             "status": result.status,
-            "signatures": result.signatures,
+            "signatures": [
+                {
+                    "id": sig.id,
+                    "signer_name": sig.signer_name,
+                    "signer_iin": sig.signer_iin,
+                    "signer_type": sig.signer_type,
+                    "status": sig.status,
+                    "signed_at": sig.signed_at.isoformat() if sig.signed_at else None,
+                }
+                for sig in result.signatures
+            ],
         })
 
 
@@ -296,16 +320,17 @@ class DocumentDownloadView(APIView):
             get_document_repository(), get_file_storage()
         )
         try:
-            file_data, filename, mime_type = use_case.execute(
-                str(document_id), request.user.id
+            stream, filename, mime_type = use_case.execute(
+                document_id, request.user.id
             )
         except DomainError as e:
             body, code = _error_response(e)
             return Response(body, status=code)
 
-        response = HttpResponse(file_data, content_type=mime_type)
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return response
+        # Sent in blocks as it is read; the response closes the stream.
+        return FileResponse(
+            stream, as_attachment=True, filename=filename, content_type=mime_type
+        )
 
 
 class DocumentDownloadSignedView(APIView):
@@ -314,16 +339,19 @@ class DocumentDownloadSignedView(APIView):
             get_document_repository(), get_file_storage()
         )
         try:
-            file_data, filename, mime_type = use_case.execute(
-                str(document_id), request.user.id
+            source, filename, mime_type = use_case.execute(
+                document_id, request.user.id
             )
         except DomainError as e:
             body, code = _error_response(e)
             return Response(body, status=code)
 
-        response = HttpResponse(file_data, content_type=mime_type)
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return response
+        if isinstance(source, str):
+            # The storage serves the bytes itself; the worker is done.
+            return HttpResponseRedirect(source)
+        return FileResponse(
+            source, as_attachment=True, filename=filename, content_type=mime_type
+        )
 
 
 class DocumentVerifyView(APIView):
@@ -332,7 +360,7 @@ class DocumentVerifyView(APIView):
             get_document_repository(), get_file_storage(), get_signing_service()
         )
         try:
-            result = use_case.execute(str(document_id), request.user.id)
+            result = use_case.execute(document_id, request.user.id)
         except DomainError as e:
             body, code = _error_response(e)
             return Response(body, status=code)
@@ -398,6 +426,7 @@ class CompleteSigningView(APIView):
                 get_signature_repository(),
                 get_file_storage(),
                 get_signing_service(),
+                get_id_generator(),
             )
             result = use_case.execute(
                 document_id=str(data["document_id"]),
@@ -415,6 +444,7 @@ class CompleteSigningView(APIView):
 # ── Package Views ────────────────────────────────────────────────────
 
 
+@method_decorator(gzip_page, name="dispatch")
 class PackageListView(APIView):
     def get(self, request):
         use_case = ListPackagesUseCase(get_package_repository())
@@ -446,7 +476,7 @@ class PackageAddDocumentView(APIView):
         )
         try:
             result = use_case.execute(
-                package_id=str(package_id),
+                package_id=package_id,
                 document_id=str(serializer.validated_data["document_id"]),
                 owner_id=request.user.id,
             )
@@ -509,6 +539,7 @@ class CompletePackageSigningView(APIView):
                 get_package_repository(),
                 get_file_storage(),
                 get_signing_service(),
+                get_id_generator(),
             )
             result = use_case.execute(
                 package_id=str(data["package_id"]),
@@ -530,7 +561,7 @@ class DocumentDownloadSignatureView(APIView):
         )
         try:
             sig_data, filename = use_case.execute(
-                str(document_id), request.user.id
+                document_id, request.user.id
             )
         except DomainError as e:
             body, code = _error_response(e)
@@ -549,13 +580,13 @@ class PackageDownloadSignedView(APIView):
             get_file_storage(),
         )
         try:
-            zip_data, zip_filename = use_case.execute(
-                str(package_id), request.user.id
+            zip_chunks, zip_filename = use_case.execute(
+                package_id, request.user.id
             )
         except DomainError as e:
             body, code = _error_response(e)
             return Response(body, status=code)
 
-        response = HttpResponse(zip_data, content_type="application/zip")
+        response = StreamingHttpResponse(zip_chunks, content_type="application/zip")
         response["Content-Disposition"] = f'attachment; filename="{zip_filename}"'
         return response
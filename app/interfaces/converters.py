@@ -0,0 +1,23 @@
+"""URL path converters shared by the API and web routes."""
+
+from django.urls import register_converter
+
+
+class UUIDStrConverter:
+    """
+    Matches the same canonical lowercase UUIDs as Django's <uuid:...> but
+    passes the matched text on as a str. That text already equals
+    str(UUID(value)), and views hand ids to use cases as strings, so building
+    a UUID object per request only to stringify it again is skipped.
+    """
+
+    regex = "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value) -> str:
+        return str(value)
+
+
+register_converter(UUIDStrConverter, "uuid_str")
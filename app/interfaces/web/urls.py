@@ -1,5 +1,6 @@
 from django.urls import path
 
+from app.interfaces import converters  # noqa: F401  (registers uuid_str)
 from app.interfaces.web import views
 
 urlpatterns = [
@@ -9,23 +10,23 @@ urlpatterns = [
     path("register/", views.register_view, name="web-register"),
     path("upload/", views.upload_view, name="web-upload"),
     path(
-        "documents/<uuid:document_id>/",
+        "documents/<uuid_str:document_id>/",
         views.document_detail_view,
         name="web-document-detail",
     ),
     path(
-        "documents/<uuid:document_id>/sign/",
+        "documents/<uuid_str:document_id>/sign/",
         views.signing_view,
         name="web-signing",
     ),
     path("packages/", views.packages_view, name="web-packages"),
     path(
-        "packages/<uuid:package_id>/",
+        "packages/<uuid_str:package_id>/",
         views.package_detail_view,
         name="web-package-detail",
     ),
     path(
-        "packages/<uuid:package_id>/sign/",
+        "packages/<uuid_str:package_id>/sign/",
         views.package_signing_view,
         name="web-package-signing",
     ),
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 import logging
 
-from collections import defaultdict
-from datetime import datetime
-
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
@@ -14,7 +11,6 @@ from app.application.use_cases import (
     AddDocumentToPackageUseCase,
     CreatePackageUseCase,
     GetDocumentStatusUseCase,
-    ListDocumentsUseCase,
     ListPackagesUseCase,
     RegisterUserUseCase,
 )
@@ -25,10 +21,8 @@ from app.infrastructure.container import (
     get_signature_repository,
     get_user_repository,
 )
-import locale
 
 logger = logging.getLogger(__name__)
-locale.setlocale(locale.LC_TIME, "ru_RU.UTF-8")
 
 
 # ── Auth Views ───────────────────────────────────────────────────────
@@ -109,50 +103,27 @@ def logout_view(request):
 
 @login_required
 def dashboard_view(request):
-    use_case = ListDocumentsUseCase(get_document_repository(), get_package_repository())
-    documents = use_case.execute(request.user.id)
-
-    grouped_packages = defaultdict(list)
-    ungrouped_documents = []
-
-    for doc in documents:
-        created_at_str = doc.get("created_at")
-        if created_at_str:
-            try:
-                # Конвертируем строку в datetime
-                created_at_dt = datetime.fromisoformat(created_at_str)
-                # Форматируем дату и время
-                doc["created_at_formatted"] = created_at_dt.strftime("%-d %B %Y года, %H:%M")
-            except ValueError:
-                doc["created_at_formatted"] = created_at_str  # оставляем как есть, если не получилось
-        else:
-            doc["created_at_formatted"] = ""
-
-        package_id = doc.get("package_id")
-        if package_id:
-            grouped_packages[package_id].append(doc)
-        else:
-            ungrouped_documents.append(doc)
-
-    packages = []
-    for package_id, docs in grouped_packages.items():
-        packages.append({
-            "id": package_id,
-            "name": docs[0].get("package_name"),
-            "documents": docs,
-        })
+    # Grouped by the database: packages with their documents prefetched,
+    # plus the documents outside any package.
+    packages = [
+        {"id": package.id, "name": package.title, "documents": docs}
+        for package, docs in get_package_repository().list_by_owner_with_documents(
+            request.user.id
+        )
+        if docs
+    ]
+    documents = get_document_repository().list_without_package(request.user.id)
 
     return render(
         request,
         "web/dashboard.html",
         {
             "packages": packages,
-            "documents": ungrouped_documents,
+            "documents": documents,
         },
     )
 
 
-
 # ── Document Detail ──────────────────────────────────────────────────
 
 
@@ -162,17 +133,13 @@ def document_detail_view(request, document_id):
         get_document_repository(), get_signature_repository()
     )
     try:
-        result = use_case.execute(str(document_id), request.user.id)
+        result = use_case.execute(document_id, request.user.id)
     except DomainError as e:
         messages.error(request, str(e))
         return redirect("web-dashboard")
 
-    # Also fetch full document info for display
-    doc_repo = get_document_repository()
-    document = doc_repo.get_by_id(str(document_id))
-
     return render(request, "web/document_detail.html", {
-        "document": document,
+        "document": result.document,
         "status_result": result,
     })
 
@@ -193,13 +160,13 @@ def upload_view(request):
 @login_required
 def signing_view(request, document_id):
     doc_repo = get_document_repository()
-    document = doc_repo.get_by_id(str(document_id))
+    document = doc_repo.get_for_read(document_id)
     if not document or document.owner_id != request.user.id:
         messages.error(request, "Документ не найден.")
         return redirect("web-dashboard")
 
     return render(request, "web/signing.html", {
-        "document_id": str(document_id),
+        "document_id": document_id,
         "document_title": document.title,
         "is_package": False,
     })
@@ -230,7 +197,7 @@ def packages_view(request):
 @login_required
 def package_detail_view(request, package_id):
     pkg_repo = get_package_repository()
-    package = pkg_repo.get_by_id(str(package_id))
+    package = pkg_repo.get_by_id(package_id)
     if not package or package.owner_id != request.user.id:
         messages.error(request, "Пакет не найден.")
         return redirect("web-packages")
@@ -243,7 +210,7 @@ def package_detail_view(request, package_id):
                     get_document_repository(), get_package_repository()
                 )
                 use_case.execute(
-                    package_id=str(package_id),
+                    package_id=package_id,
                     document_id=document_id,
                     owner_id=request.user.id,
                 )
@@ -254,9 +221,8 @@ def package_detail_view(request, package_id):
 
     # Get documents in this package
     doc_repo = get_document_repository()
-    all_docs = doc_repo.list_by_owner(request.user.id)
-    package_docs = [d for d in all_docs if d.package_id == str(package_id)]
-    available_docs = [d for d in all_docs if not d.package_id and d.status != "signed"]
+    package_docs = doc_repo.list_by_package(request.user.id, package_id)
+    available_docs = doc_repo.list_available_for_package(request.user.id)
 
     return render(request, "web/package_detail.html", {
         "package": package,
@@ -268,13 +234,13 @@ def package_detail_view(request, package_id):
 @login_required
 def package_signing_view(request, package_id):
     pkg_repo = get_package_repository()
-    package = pkg_repo.get_by_id(str(package_id))
+    package = pkg_repo.get_by_id(package_id)
     if not package or package.owner_id != request.user.id:
         messages.error(request, "Пакет не найден.")
         return redirect("web-packages")
 
     return render(request, "web/signing.html", {
-        "document_id": str(package_id),
+        "document_id": package_id,
         "document_title": package.title,
         "is_package": True,
     })
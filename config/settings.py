@@ -3,10 +3,12 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
-
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# An explicit path skips find_dotenv's call-stack inspection and directory
+# walk. Variables already set in the environment still take precedence.
+load_dotenv(BASE_DIR / ".env")
+
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "change-me-in-production")
 
 DEBUG = os.getenv("DJANGO_DEBUG", "True").lower() in ("true", "1", "yes")
@@ -101,6 +103,12 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # The browsable API renders HTML forms around every response a browser
+    # asks for; outside development only JSON is offered.
+    "DEFAULT_RENDERER_CLASSES": [
+        "rest_framework.renderers.JSONRenderer",
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    ],
 }
 
 # CORS
@@ -113,6 +121,7 @@ SIGEX_BASE_URL = os.getenv("SIGEX_BASE_URL", "https://sigex.kz")
 SIGEX_TIMEOUT = int(os.getenv("SIGEX_TIMEOUT", "30"))
 SIGEX_QR_POLL_RETRIES = int(os.getenv("SIGEX_QR_POLL_RETRIES", "60"))
 SIGEX_QR_POLL_INTERVAL = int(os.getenv("SIGEX_QR_POLL_INTERVAL", "3"))
+SIGEX_MAX_RETRY_INTERVAL = int(os.getenv("SIGEX_MAX_RETRY_INTERVAL", "60"))
 
 # File storage
 FILE_STORAGE_BACKEND = os.getenv("FILE_STORAGE_BACKEND", "local")  # "local" or "s3"
@@ -124,6 +133,13 @@ AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME", "")
 AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL", "")
 AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME", "")
 
+AUTHENTICATION_BACKENDS = [
+    "app.infrastructure.auth.ProfileModelBackend",
+    # Resolves sessions created before ProfileModelBackend was added; can be
+    # dropped once those have expired.
+    "django.contrib.auth.backends.ModelBackend",
+]
+
 LOGIN_URL = "/login/"
 LOGIN_REDIRECT_URL = "/"
 
@@ -17,3 +17,7 @@ FILE_STORAGE_BACKEND = "local"
 
 # Simple static files storage for tests (no manifest required)
 STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
+
+# Tests never request static files; WhiteNoise would scan STATIC_ROOT each
+# time a test client builds its handler.
+MIDDLEWARE = [m for m in MIDDLEWARE if not m.startswith("whitenoise.")]  # noqa: F405
@@ -1,5 +1,9 @@
+import base64
+import hashlib
+
 import pytest
 from django.contrib.auth.models import User
+from rest_framework.test import APIClient
 
 from app.infrastructure.persistence.models import UserProfile
 
@@ -32,7 +36,6 @@ def legal_user(db):
 
 @pytest.fixture
 def api_client():
-    from rest_framework.test import APIClient
     return APIClient()
 
 
@@ -48,7 +51,7 @@ def legal_auth_client(api_client, legal_user):
     return api_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf():
     # Minimal valid PDF
     return (
@@ -61,10 +64,14 @@ def sample_pdf():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_pdf_sha256(sample_pdf):
+    return hashlib.sha256(sample_pdf).hexdigest()
+
+
+@pytest.fixture(scope="session")
 def sample_png():
     # Minimal 1x1 white PNG
-    import base64
     data = base64.b64decode(
         "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4"
         "nGP4z8BQDwAEgAF/pooBPQAAAABJRU5ErkJggg=="
@@ -1,16 +1,50 @@
 """Integration tests for REST API endpoints."""
 
+import gzip
 import io
 import json
+import tempfile
 import zipfile
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.conf import settings
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from app.domain.entities import DocumentStatus, QRSigningSession
+from app.domain.entities import Document, DocumentStatus, QRSigningSession
+from app.infrastructure.container import get_file_storage
+from app.infrastructure.persistence.models import DocumentModel, UserProfile
+from app.infrastructure.persistence.repositories import DjangoDocumentRepository
+
+
+def _collect(response):
+    """Spool a streaming response body into a rewound file object."""
+    f = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    for chunk in response.streaming_content:
+        f.write(chunk)
+    f.seek(0)
+    return f
+
+
+@pytest.fixture
+def uploaded_document(user, sample_pdf, sample_pdf_sha256):
+    """A stored PDF owned by ``user``, created without the upload endpoint."""
+    document = Document(
+        title="Test",
+        filename="test.pdf",
+        mime_type="application/pdf",
+        file_size=len(sample_pdf),
+        sha256=sample_pdf_sha256,
+        owner_id=user.id,
+    )
+    document.file_path = f"documents/{document.id}/test.pdf"
+    get_file_storage().save_file(document.file_path, sample_pdf)
+    return DjangoDocumentRepository().save(document)
 
 
 @pytest.mark.django_db
@@ -82,6 +116,26 @@ class TestAuthAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["username"] == "testuser"
 
+    def test_login_after_register(self, api_client):
+        api_client.post(
+            "/api/auth/register/",
+            {
+                "username": "newuser",
+                "password": "securepass123",
+                "iin": "123456789012",
+                "full_name": "New User",
+                "signer_type": "individual",
+            },
+            format="json",
+        )
+        api_client.logout()
+        response = api_client.post(
+            "/api/auth/login/",
+            {"username": "newuser", "password": "securepass123"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+
     def test_login_invalid(self, api_client, user):
         response = api_client.post(
             "/api/auth/login/",
@@ -100,6 +154,30 @@ class TestAuthAPI:
         assert response.data["iin"] == "123456789012"
         assert response.data["full_name"] == "Test User"
 
+    def test_session_user_loads_profile_with_user(self, api_client, user):
+        api_client.login(username="testuser", password="testpass123")
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get("/api/auth/profile/")
+        assert response.status_code == status.HTTP_200_OK
+        profile_table = UserProfile._meta.db_table
+        assert not any(
+            f'FROM "{profile_table}"' in q["sql"] for q in ctx.captured_queries
+        )
+
+    def test_login_invalid_password_tries_every_backend(self, api_client, user):
+        with patch(
+            "django.contrib.auth.backends.ModelBackend.authenticate",
+            autospec=True, return_value=None,
+        ) as authenticate:
+            response = api_client.post(
+                "/api/auth/login/",
+                {"username": "testuser", "password": "wrong"},
+                format="json",
+            )
+        assert response.status_code != status.HTTP_200_OK
+        # A failed check does not stop the chain of AUTHENTICATION_BACKENDS.
+        assert authenticate.call_count == len(settings.AUTHENTICATION_BACKENDS)
+
     def test_unauthenticated_access(self, api_client):
         response = api_client.get("/api/documents/")
         assert response.status_code in (
@@ -110,7 +188,7 @@ class TestAuthAPI:
 
 @pytest.mark.django_db
 class TestDocumentAPI:
-    def test_upload_pdf(self, auth_client, sample_pdf):
+    def test_upload_pdf(self, auth_client, sample_pdf, sample_pdf_sha256):
         pdf_file = io.BytesIO(sample_pdf)
         pdf_file.name = "test.pdf"
 
@@ -122,7 +200,7 @@ class TestDocumentAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["filename"] == "test.pdf"
         assert response.data["status"] == "uploaded"
-        assert len(response.data["sha256"]) == 64
+        assert response.data["sha256"] == sample_pdf_sha256
 
     def test_upload_png(self, auth_client, sample_png):
         png_file = io.BytesIO(sample_png)
@@ -135,57 +213,76 @@ class TestDocumentAPI:
         )
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_list_documents(self, auth_client, sample_pdf):
-        # Upload first
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-
+    def test_list_documents(self, auth_client, uploaded_document):
         response = auth_client.get("/api/documents/")
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
 
-    def test_document_detail(self, auth_client, sample_pdf):
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        upload = auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-        doc_id = upload.data["document_id"]
+    def test_list_documents_gzipped(self, auth_client, sample_pdf):
+        for _ in range(3):
+            pdf_file = io.BytesIO(sample_pdf)
+            pdf_file.name = "test.pdf"
+            auth_client.post(
+                "/api/documents/upload/",
+                {"file": pdf_file, "title": "Test"},
+                format="multipart",
+            )
+
+        response = auth_client.get("/api/documents/", HTTP_ACCEPT_ENCODING="gzip")
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert len(json.loads(gzip.decompress(response.content))) == 3
+
+    def test_list_documents_query_count_constant(self, auth_client, sample_pdf):
+        pkg_id = auth_client.post(
+            "/api/packages/create/", {"title": "Pkg"}, format="json",
+        ).data["id"]
+
+        def upload_into_package():
+            pdf_file = io.BytesIO(sample_pdf)
+            pdf_file.name = "test.pdf"
+            doc_id = auth_client.post(
+                "/api/documents/upload/",
+                {"file": pdf_file, "title": "Test"},
+                format="multipart",
+            ).data["document_id"]
+            auth_client.post(
+                f"/api/packages/{pkg_id}/add-document/",
+                {"document_id": doc_id},
+                format="json",
+            )
+
+        def count_list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = auth_client.get("/api/documents/")
+            assert response.status_code == status.HTTP_200_OK
+            return len(ctx.captured_queries)
+
+        upload_into_package()
+        one = count_list_queries()
+        upload_into_package()
+        upload_into_package()
+        assert count_list_queries() == one
+
+    def test_document_detail(self, auth_client, uploaded_document):
+        doc_id = uploaded_document.id
 
         response = auth_client.get(f"/api/documents/{doc_id}/")
         assert response.status_code == status.HTTP_200_OK
         assert response.data["document_id"] == doc_id
 
-    def test_document_download(self, auth_client, sample_pdf):
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        upload = auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-        doc_id = upload.data["document_id"]
+    def test_document_download(self, auth_client, uploaded_document, sample_pdf):
+        doc_id = uploaded_document.id
 
         response = auth_client.get(f"/api/documents/{doc_id}/download/")
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "application/pdf"
+        assert response.streaming
+        assert b"".join(response.streaming_content) == sample_pdf
 
-    def test_document_verify(self, auth_client, sample_pdf):
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        upload = auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-        doc_id = upload.data["document_id"]
+    def test_document_verify(self, auth_client, uploaded_document):
+        doc_id = uploaded_document.id
 
         response = auth_client.post(f"/api/documents/{doc_id}/verify/")
         assert response.status_code == status.HTTP_200_OK
@@ -210,6 +307,17 @@ class TestDocumentAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert len(response.data["documents"]) == 2
 
+    def test_update_many_keeps_updated_at(self, uploaded_document):
+        repo = DjangoDocumentRepository()
+        now = uploaded_document.updated_at + timedelta(minutes=5)
+        uploaded_document.mark_failed("boom", now=now)
+
+        repo.update_many([uploaded_document])
+
+        stored = repo.get_by_id(uploaded_document.id)
+        assert stored.status == DocumentStatus.FAILED
+        assert stored.updated_at == now
+
 
 @pytest.mark.django_db
 class TestSigningAPI:
@@ -332,7 +440,6 @@ class TestPackageAPI:
             )
 
         # Mark documents as signed manually via the DB
-        from app.infrastructure.persistence.models import DocumentModel
         for doc_id in doc_ids:
             dm = DocumentModel.objects.get(id=doc_id)
             dm.status = "signed"
@@ -341,16 +448,17 @@ class TestPackageAPI:
 
         # Mock file storage to return data
         mock_storage = MagicMock()
-        mock_storage.read_file.return_value = sample_pdf
+        mock_storage.open_stream.side_effect = lambda path: io.BytesIO(sample_pdf)
         mock_get_storage.return_value = mock_storage
 
         response = auth_client.get(f"/api/packages/{pkg_id}/download-signed/")
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "application/zip"
 
-        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)
-                                         if hasattr(response, 'streaming_content')
-                                         else response.content)) as z:
+        assert response.streaming
+
+        # namelist() only reads the central directory at the end.
+        with _collect(response) as f, zipfile.ZipFile(f) as z:
             names = z.namelist()
             assert any("originals/" in n for n in names)
             assert any("signatures/" in n for n in names)
@@ -360,29 +468,15 @@ class TestPackageAPI:
         response = auth_client.get(f"/api/packages/{fake_id}/download-signed/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_document_download_original_alias(self, auth_client, sample_pdf):
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        upload = auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-        doc_id = upload.data["document_id"]
+    def test_document_download_original_alias(self, auth_client, uploaded_document):
+        doc_id = uploaded_document.id
 
         response = auth_client.get(f"/api/documents/{doc_id}/download/original/")
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "application/pdf"
 
-    def test_document_download_signature_no_signature(self, auth_client, sample_pdf):
-        pdf_file = io.BytesIO(sample_pdf)
-        pdf_file.name = "test.pdf"
-        upload = auth_client.post(
-            "/api/documents/upload/",
-            {"file": pdf_file, "title": "Test"},
-            format="multipart",
-        )
-        doc_id = upload.data["document_id"]
+    def test_document_download_signature_no_signature(self, auth_client, uploaded_document):
+        doc_id = uploaded_document.id
 
         response = auth_client.get(f"/api/documents/{doc_id}/download/signature/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,12 +1,18 @@
 """Integration tests for web UI views."""
 
 import uuid
+from datetime import datetime, timezone
 
 import pytest
 from django.contrib.auth.models import User
 from django.test import Client
 
-from app.infrastructure.persistence.models import UserProfile
+from app.domain.entities import Document, DocumentStatus, Package
+from app.infrastructure.persistence.models import DocumentModel, UserProfile
+from app.infrastructure.persistence.repositories import (
+    DjangoDocumentRepository,
+    DjangoPackageRepository,
+)
 
 
 @pytest.fixture
@@ -131,6 +137,17 @@ class TestWebRegister:
         assert response.status_code == 200
         assert not User.objects.filter(username="badiin").exists()
 
+    def test_register_non_ascii_digit_iin(self, web_client):
+        response = web_client.post("/register/", {
+            "username": "arabiciin",
+            "password": "securepass123",
+            "iin": "\u0661" * 12,
+            "full_name": "Arabic Digits",
+            "signer_type": "individual",
+        })
+        assert response.status_code == 200
+        assert not User.objects.filter(username="arabiciin").exists()
+
     def test_register_short_password(self, web_client):
         response = web_client.post("/register/", {
             "username": "shortpass",
@@ -180,6 +197,33 @@ class TestWebDashboard:
         response = auth_web_client.get("/")
         assert "Документов пока нет".encode() in response.content
 
+    def test_dashboard_groups_by_package(self, auth_web_client, user):
+        package = DjangoPackageRepository().save(
+            Package(title="Pkg", owner_id=user.id)
+        )
+        DjangoPackageRepository().save(Package(title="Empty", owner_id=user.id))
+        doc_repo = DjangoDocumentRepository()
+        in_pkg = doc_repo.save(Document(
+            title="In", owner_id=user.id, package_id=package.id,
+        ))
+        free = doc_repo.save(Document(title="Free", owner_id=user.id))
+
+        response = auth_web_client.get("/")
+        packages = response.context["packages"]
+        assert [p["name"] for p in packages] == ["Pkg"]
+        assert [d.id for d in packages[0]["documents"]] == [in_pkg.id]
+        assert [d.id for d in response.context["documents"]] == [free.id]
+
+    def test_dashboard_formats_dates_in_russian(self, auth_web_client, user):
+        doc = DjangoDocumentRepository().save(
+            Document(title="Contract", owner_id=user.id)
+        )
+        DocumentModel.objects.filter(id=doc.id).update(
+            created_at=datetime(2026, 3, 15, 9, 30, tzinfo=timezone.utc)
+        )
+        response = auth_web_client.get("/")
+        assert "15 марта 2026 года".encode() in response.content
+
 
 # ── Upload Tests ─────────────────────────────────────────────────────
 
@@ -212,6 +256,15 @@ class TestWebDocumentDetail:
         response = auth_web_client.get(f"/documents/{doc_id}/")
         assert response.status_code == 302
 
+    def test_document_detail_renders(self, auth_web_client, user):
+        doc = DjangoDocumentRepository().save(
+            Document(title="Contract", filename="c.pdf", owner_id=user.id)
+        )
+        response = auth_web_client.get(f"/documents/{doc.id}/")
+        assert response.status_code == 200
+        assert response.context["document"].id == doc.id
+        assert "Contract".encode() in response.content
+
 
 # ── Signing Tests ────────────────────────────────────────────────────
 
@@ -258,6 +311,24 @@ class TestWebPackages:
         })
         assert response.status_code == 200
 
+    def test_package_detail_splits_documents(self, auth_web_client, user):
+        package = DjangoPackageRepository().save(
+            Package(title="Pkg", owner_id=user.id)
+        )
+        doc_repo = DjangoDocumentRepository()
+        in_pkg = doc_repo.save(Document(
+            title="In", owner_id=user.id, package_id=package.id,
+        ))
+        free = doc_repo.save(Document(title="Free", owner_id=user.id))
+        doc_repo.save(Document(
+            title="Signed", owner_id=user.id, status=DocumentStatus.SIGNED,
+        ))
+
+        response = auth_web_client.get(f"/packages/{package.id}/")
+        assert response.status_code == 200
+        assert [d.id for d in response.context["package_docs"]] == [in_pkg.id]
+        assert [d.id for d in response.context["available_docs"]] == [free.id]
+
     def test_package_detail_not_found_redirects(self, auth_web_client):
         pkg_id = uuid.uuid4()
         response = auth_web_client.get(f"/packages/{pkg_id}/")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import io
+import threading
+import zipfile
 from unittest.mock import MagicMock, patch
 
 import pytest
+import responses
 
 from app.application.use_cases import (
     AddDocumentToPackageUseCase,
@@ -11,6 +15,7 @@ from app.application.use_cases import (
     CreatePackageUseCase,
     DownloadDocumentUseCase,
     DownloadSignatureUseCase,
+    DownloadSignedDocumentUseCase,
     DownloadSignedPackageUseCase,
     GetDocumentStatusUseCase,
     InitiateQRSigningUseCase,
@@ -18,8 +23,10 @@ from app.application.use_cases import (
     ListPackagesUseCase,
     UploadDocumentUseCase,
     VerifyDocumentUseCase,
+    _upload_from_storage,
 )
 from app.domain.exceptions import SigningError
+from app.domain.ports import StorageStat
 from app.domain.entities import (
     Document,
     DocumentStatus,
@@ -37,6 +44,7 @@ from app.domain.exceptions import (
     InvalidDocumentError,
     PackageNotFoundError,
 )
+from app.infrastructure.sigex.client import SigexClient
 
 
 @pytest.fixture
@@ -102,11 +110,11 @@ def sample_document():
 class TestUploadDocumentUseCase:
     def test_upload_pdf_success(self, mock_doc_repo, mock_file_storage):
         mock_doc_repo.save.side_effect = lambda d: d
-        mock_file_storage.save_file.return_value = "documents/x/test.pdf"
+        mock_file_storage.save_stream.return_value = "documents/x/test.pdf"
 
         uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
         result = uc.execute(
-            file_data=b"pdf data",
+            file_obj=io.BytesIO(b"pdf data"),
             filename="test.pdf",
             mime_type="application/pdf",
             title="Test Doc",
@@ -116,14 +124,14 @@ class TestUploadDocumentUseCase:
         assert result.filename == "test.pdf"
         assert result.title == "Test Doc"
         assert result.status == "uploaded"
-        mock_file_storage.save_file.assert_called_once()
+        mock_file_storage.save_stream.assert_called_once()
         mock_doc_repo.save.assert_called_once()
 
     def test_upload_png_success(self, mock_doc_repo, mock_file_storage):
         mock_doc_repo.save.side_effect = lambda d: d
         uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
         result = uc.execute(
-            file_data=b"png data",
+            file_obj=io.BytesIO(b"png data"),
             filename="scan.png",
             mime_type="image/png",
             title="Scan",
@@ -135,7 +143,7 @@ class TestUploadDocumentUseCase:
         uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
         with pytest.raises(InvalidDocumentError, match="Unsupported file type"):
             uc.execute(
-                file_data=b"data",
+                file_obj=io.BytesIO(b"data"),
                 filename="test.docx",
                 mime_type="application/msword",
                 title="Test",
@@ -146,7 +154,7 @@ class TestUploadDocumentUseCase:
         mock_doc_repo.save.side_effect = lambda d: d
         uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
         result = uc.execute(
-            file_data=b"pdf data",
+            file_obj=io.BytesIO(b"pdf data"),
             filename="test.pdf",
             mime_type="application/pdf",
             title="Test",
@@ -157,15 +165,74 @@ class TestUploadDocumentUseCase:
 
     def test_sha256_computed(self, mock_doc_repo, mock_file_storage):
         mock_doc_repo.save.side_effect = lambda d: d
+        mock_file_storage.save_stream.side_effect = lambda path, src: src.read()
         uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
         result = uc.execute(
-            file_data=b"test",
+            file_obj=io.BytesIO(b"test"),
             filename="test.pdf",
             mime_type="application/pdf",
             title="Test",
             owner_id=1,
         )
         assert len(result.sha256) == 64  # SHA-256 hex length
+        assert result.sha256 == Document.compute_sha256(b"test")
+
+    def test_sha256_computed_with_readinto(self, mock_doc_repo, mock_file_storage):
+        def save_stream(path, src):
+            buf = bytearray(3)
+            while src.readinto(buf):
+                pass
+
+        mock_doc_repo.save.side_effect = lambda d: d
+        mock_file_storage.save_stream.side_effect = save_stream
+        uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
+        result = uc.execute(
+            file_obj=io.BytesIO(b"test data"),
+            filename="test.pdf",
+            mime_type="application/pdf",
+            title="Test",
+            owner_id=1,
+        )
+        assert result.sha256 == Document.compute_sha256(b"test data")
+        assert mock_doc_repo.save.call_args[0][0].file_size == 9
+
+    def test_execute_many_keeps_order_and_errors(
+        self, mock_doc_repo, mock_file_storage
+    ):
+        mock_doc_repo.save.side_effect = lambda d: d
+        mock_file_storage.save_stream.side_effect = lambda path, src: src.read()
+        uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage)
+        results = uc.execute_many(
+            [
+                (io.BytesIO(b"one"), "a.pdf", "application/pdf", "A"),
+                (io.BytesIO(b"two"), "b.docx", "application/msword", "B"),
+                (io.BytesIO(b"three"), "c.png", "image/png", "C"),
+            ],
+            owner_id=1,
+        )
+
+        assert results[0].filename == "a.pdf"
+        assert results[0].sha256 == Document.compute_sha256(b"one")
+        assert isinstance(results[1], InvalidDocumentError)
+        assert results[2].filename == "c.png"
+        assert mock_doc_repo.save.call_count == 2
+
+    def test_uses_injected_id_generator(self, mock_doc_repo, mock_file_storage):
+        mock_doc_repo.save.side_effect = lambda d: d
+        id_generator = MagicMock()
+        id_generator.new_id.return_value = "fixed-id"
+        uc = UploadDocumentUseCase(mock_doc_repo, mock_file_storage, id_generator)
+        result = uc.execute(
+            file_obj=io.BytesIO(b"test"),
+            filename="test.pdf",
+            mime_type="application/pdf",
+            title="Test",
+            owner_id=1,
+        )
+        assert result.document_id == "fixed-id"
+        assert mock_file_storage.save_stream.call_args[0][0] == (
+            "documents/fixed-id/test.pdf"
+        )
 
 
 class TestInitiateQRSigningUseCase:
@@ -241,11 +308,48 @@ class TestCompleteQRSigningUseCase:
         mock_signing_service.send_data_for_signing.assert_called_once()
         mock_signing_service.poll_signatures.assert_called_once()
         mock_sig_repo.save.assert_called_once()
+        mock_file_storage.link_file.assert_called_once_with(
+            "documents/doc-123/test.pdf",
+            "documents/doc-123/test-sigexsigex-doc-1.pdf",
+        )
+        # The upload streams the stored file rather than reusing the bytes.
+        mock_file_storage.open_stream.assert_called_once_with(
+            "documents/doc-123/test.pdf"
+        )
+        args, kwargs = mock_signing_service.upload_document_data.call_args
+        assert args[1] is mock_file_storage.open_stream.return_value
+        assert kwargs["size"] == sample_document.file_size
+
+    def test_upload_failure_saves_no_signature(
+        self,
+        mock_doc_repo,
+        mock_sig_repo,
+        mock_file_storage,
+        mock_signing_service,
+        signer,
+        sample_document,
+    ):
+        mock_doc_repo.get_by_id.return_value = sample_document
+        mock_file_storage.read_file.return_value = b"pdf data"
+        mock_signing_service.poll_signatures.return_value = ["dGVzdHNpZw=="]
+        mock_signing_service.register_document.return_value = "sigex-doc-1"
+        mock_signing_service.upload_document_data.side_effect = SigningError("boom")
+
+        uc = CompleteQRSigningUseCase(
+            mock_doc_repo, mock_sig_repo, mock_file_storage, mock_signing_service
+        )
+        with pytest.raises(SigningError):
+            uc.execute(
+                "doc-123", owner_id=1, signer=signer, qr_session=QRSigningSession()
+            )
+
+        mock_sig_repo.save.assert_not_called()
+        assert sample_document.status == DocumentStatus.FAILED
 
 
 class TestGetDocumentStatusUseCase:
     def test_success(self, mock_doc_repo, mock_sig_repo, sample_document):
-        mock_doc_repo.get_by_id.return_value = sample_document
+        mock_doc_repo.get_for_read.return_value = sample_document
         sig = Signature(
             document_id="doc-123",
             signer_iin="123456789012",
@@ -260,9 +364,13 @@ class TestGetDocumentStatusUseCase:
         assert result.document_id == "doc-123"
         assert result.status == "uploaded"
         assert len(result.signatures) == 1
+        assert result.signatures[0].signer_name == "Test"
+        assert result.signatures[0].status == "completed"
+        assert result.document is sample_document
+        mock_doc_repo.get_for_read.assert_called_once()
 
     def test_not_found(self, mock_doc_repo, mock_sig_repo):
-        mock_doc_repo.get_by_id.return_value = None
+        mock_doc_repo.get_for_read.return_value = None
         uc = GetDocumentStatusUseCase(mock_doc_repo, mock_sig_repo)
         with pytest.raises(DocumentNotFoundError):
             uc.execute("missing", owner_id=1)
@@ -280,7 +388,7 @@ class TestVerifyDocumentUseCase:
             owner_id=1,
         )
         mock_doc_repo.get_by_id.return_value = doc
-        mock_file_storage.read_file.return_value = data
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(data)
 
         uc = VerifyDocumentUseCase(
             mock_doc_repo, mock_file_storage, mock_signing_service
@@ -289,6 +397,7 @@ class TestVerifyDocumentUseCase:
 
         assert result.checksum_match is True
         assert result.verified is True
+        mock_file_storage.read_file.assert_not_called()
 
     def test_checksum_mismatch(
         self, mock_doc_repo, mock_file_storage, mock_signing_service
@@ -300,7 +409,9 @@ class TestVerifyDocumentUseCase:
             owner_id=1,
         )
         mock_doc_repo.get_by_id.return_value = doc
-        mock_file_storage.read_file.return_value = b"test data"
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(
+            b"test data"
+        )
 
         uc = VerifyDocumentUseCase(
             mock_doc_repo, mock_file_storage, mock_signing_service
@@ -310,6 +421,42 @@ class TestVerifyDocumentUseCase:
         assert result.checksum_match is False
         assert result.verified is False
 
+    def test_recorded_digest_skips_read(
+        self, mock_doc_repo, mock_file_storage, mock_signing_service
+    ):
+        doc = Document(id="doc-1", sha256="abc", file_path="test.pdf", owner_id=1)
+        mock_doc_repo.get_by_id.return_value = doc
+        mock_file_storage.stat_with_digest.return_value = StorageStat(
+            size=9, sha256="abc"
+        )
+
+        uc = VerifyDocumentUseCase(
+            mock_doc_repo, mock_file_storage, mock_signing_service
+        )
+        result = uc.execute("doc-1", owner_id=1)
+
+        assert result.checksum_match is True
+        assert result.verified is True
+        mock_file_storage.read_file.assert_not_called()
+
+    def test_computed_digest_is_recorded(
+        self, mock_doc_repo, mock_file_storage, mock_signing_service
+    ):
+        data = b"test data"
+        doc = Document(id="doc-1", sha256="wrong_hash", file_path="test.pdf", owner_id=1)
+        mock_doc_repo.get_by_id.return_value = doc
+        mock_file_storage.stat_with_digest.return_value = StorageStat(size=9)
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(data)
+
+        uc = VerifyDocumentUseCase(
+            mock_doc_repo, mock_file_storage, mock_signing_service
+        )
+        uc.execute("doc-1", owner_id=1)
+
+        mock_file_storage.record_digest.assert_called_once_with(
+            "test.pdf", Document.compute_sha256(data)
+        )
+
     def test_sigex_verification(
         self, mock_doc_repo, mock_file_storage, mock_signing_service
     ):
@@ -322,7 +469,8 @@ class TestVerifyDocumentUseCase:
             sigex_document_id="sigex-1",
         )
         mock_doc_repo.get_by_id.return_value = doc
-        mock_file_storage.read_file.return_value = data
+        mock_file_storage.stat_with_digest.return_value = StorageStat(size=9)
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(data)
         mock_signing_service.verify_document.return_value = True
 
         uc = VerifyDocumentUseCase(
@@ -332,17 +480,49 @@ class TestVerifyDocumentUseCase:
 
         assert result.sigex_verified is True
         assert result.verified is True
+        mock_file_storage.read_file.assert_not_called()
+        _, kwargs = mock_signing_service.verify_document.call_args
+        assert kwargs["size"] == 9
+
+    def test_each_call_checks_the_stored_file(
+        self, mock_doc_repo, mock_file_storage, mock_signing_service
+    ):
+        data = b"test data"
+        doc = Document(
+            id="doc-1",
+            sha256=Document.compute_sha256(data),
+            file_path="test.pdf",
+            owner_id=1,
+        )
+        mock_doc_repo.get_by_id.return_value = doc
+        mock_file_storage.stat_with_digest.return_value = StorageStat(size=9)
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(data)
+
+        uc = VerifyDocumentUseCase(
+            mock_doc_repo, mock_file_storage, mock_signing_service
+        )
+        assert uc.execute("doc-1", owner_id=1).verified is True
+
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(
+            b"tampered"
+        )
+        result = uc.execute("doc-1", owner_id=1)
+
+        assert result.checksum_match is False
+        assert result.verified is False
 
 
 class TestDownloadDocumentUseCase:
     def test_success(self, mock_doc_repo, mock_file_storage, sample_document):
         mock_doc_repo.get_by_id.return_value = sample_document
-        mock_file_storage.read_file.return_value = b"file data"
+        stream = io.BytesIO(b"file data")
+        mock_file_storage.open_stream.return_value = stream
 
         uc = DownloadDocumentUseCase(mock_doc_repo, mock_file_storage)
         data, filename, mime = uc.execute("doc-123", owner_id=1)
 
-        assert data == b"file data"
+        assert data is stream
+        mock_file_storage.read_file.assert_not_called()
         assert filename == "test.pdf"
         assert mime == "application/pdf"
 
@@ -353,14 +533,50 @@ class TestDownloadDocumentUseCase:
             uc.execute("missing", owner_id=1)
 
 
+class TestDownloadSignedDocumentUseCase:
+    def test_redirects_when_storage_has_url(
+        self, mock_doc_repo, mock_file_storage, sample_document,
+    ):
+        sample_document.signed_file_path = "documents/doc-123/signed_test.pdf"
+        mock_doc_repo.get_by_id.return_value = sample_document
+        mock_file_storage.download_url.return_value = "https://s3.example/x"
+
+        uc = DownloadSignedDocumentUseCase(mock_doc_repo, mock_file_storage)
+        source, filename, mime = uc.execute("doc-123", owner_id=1)
+
+        assert source == "https://s3.example/x"
+        assert filename == "signed_test.pdf"
+        mock_file_storage.download_url.assert_called_once_with(
+            "documents/doc-123/signed_test.pdf", "signed_test.pdf",
+            "application/pdf",
+        )
+        mock_file_storage.open_stream.assert_not_called()
+
+    def test_streams_without_url(
+        self, mock_doc_repo, mock_file_storage, sample_document,
+    ):
+        sample_document.signed_file_path = "documents/doc-123/signed_test.pdf"
+        mock_doc_repo.get_by_id.return_value = sample_document
+        mock_file_storage.download_url.return_value = None
+        stream = io.BytesIO(b"signed")
+        mock_file_storage.open_stream.return_value = stream
+
+        uc = DownloadSignedDocumentUseCase(mock_doc_repo, mock_file_storage)
+        source, _, _ = uc.execute("doc-123", owner_id=1)
+
+        assert source is stream
+
+
 class TestListDocumentsUseCase:
-    def test_returns_list(self, mock_doc_repo, mock_pkg_repo, sample_document):
-        mock_doc_repo.list_by_owner.return_value = [sample_document]
-        mock_pkg_repo.list_by_owner.return_value = []
-        uc = ListDocumentsUseCase(mock_doc_repo, mock_pkg_repo)
+    def test_returns_list(self, mock_doc_repo, sample_document):
+        mock_doc_repo.list_by_owner_with_package_titles.return_value = [
+            (sample_document, "Contracts")
+        ]
+        uc = ListDocumentsUseCase(mock_doc_repo)
         result = uc.execute(owner_id=1)
         assert len(result) == 1
         assert result[0]["id"] == "doc-123"
+        assert result[0]["package_name"] == "Contracts"
 
 
 class TestCreatePackageUseCase:
@@ -376,12 +592,13 @@ class TestAddDocumentToPackageUseCase:
     def test_success(self, mock_doc_repo, mock_pkg_repo, sample_document):
         pkg = Package(id="pkg-1", title="Test", owner_id=1)
         mock_pkg_repo.get_by_id.return_value = pkg
-        mock_doc_repo.get_by_id.return_value = sample_document
-        mock_doc_repo.update.side_effect = lambda d: d
+        mock_doc_repo.get_for_read.return_value = sample_document
 
         uc = AddDocumentToPackageUseCase(mock_doc_repo, mock_pkg_repo)
         result = uc.execute("pkg-1", "doc-123", owner_id=1)
         assert result["status"] == "added"
+        mock_doc_repo.attach_to_package.assert_called_once_with(["doc-123"], "pkg-1")
+        mock_doc_repo.update.assert_not_called()
 
     def test_package_not_found(self, mock_doc_repo, mock_pkg_repo):
         mock_pkg_repo.get_by_id.return_value = None
@@ -425,9 +642,9 @@ class TestCompletePackageQRSigningUseCase:
             document_ids=["doc-1", "doc-2"],
         )
         mock_pkg_repo.get_by_id.return_value = self.pkg
-        mock_doc_repo.get_by_id.side_effect = lambda did: {
-            "doc-1": self.doc1, "doc-2": self.doc2,
-        }.get(did)
+        mock_doc_repo.get_many.side_effect = lambda ids: {
+            d.id: d for d in (self.doc1, self.doc2) if d.id in ids
+        }
         mock_doc_repo.update.side_effect = lambda d: d
         mock_sig_repo.save.side_effect = lambda s: s
         mock_file_storage.read_file.return_value = b"pdf data"
@@ -459,6 +676,27 @@ class TestCompletePackageQRSigningUseCase:
         assert len(result["documents"]) == 2
         assert all("document_id" in d for d in result["documents"])
 
+    @pytest.mark.usefixtures("_setup")
+    def test_repositories_used_from_calling_thread(
+        self, mock_doc_repo, mock_sig_repo, mock_pkg_repo,
+        mock_file_storage, mock_signing_service, signer,
+    ):
+        threads = set()
+
+        def record(entity):
+            threads.add(threading.get_ident())
+            return entity
+
+        mock_doc_repo.update.side_effect = record
+        mock_sig_repo.save.side_effect = record
+        uc = CompletePackageQRSigningUseCase(
+            mock_doc_repo, mock_sig_repo, mock_pkg_repo,
+            mock_file_storage, mock_signing_service,
+        )
+        uc.execute("pkg-1", owner_id=1, signer=signer, qr_session=self.session)
+
+        assert threads == {threading.get_ident()}
+
     @pytest.mark.usefixtures("_setup")
     def test_partial_failure_marks_partially_signed(
         self, mock_doc_repo, mock_sig_repo, mock_pkg_repo,
@@ -511,6 +749,9 @@ class TestCompletePackageQRSigningUseCase:
             uc.execute(
                 "pkg-1", owner_id=1, signer=signer, qr_session=self.session,
             )
+        mock_doc_repo.update_many.assert_called_once()
+        assert self.doc1.status == DocumentStatus.FAILED
+        assert self.doc2.status == DocumentStatus.FAILED
 
     def test_package_not_found(
         self, mock_doc_repo, mock_sig_repo, mock_pkg_repo,
@@ -587,9 +828,6 @@ class TestDownloadSignedPackageUseCase:
     def test_zip_contains_signed_documents(
         self, mock_doc_repo, mock_pkg_repo, mock_file_storage,
     ):
-        import zipfile as zf
-        import io
-
         pkg = Package(
             id="pkg-1", title="Test", owner_id=1,
             document_ids=["doc-1", "doc-2"],
@@ -607,24 +845,22 @@ class TestDownloadSignedPackageUseCase:
             signature_file_path="documents/doc-2/signatures/s2.cms",
         )
         mock_pkg_repo.get_by_id.return_value = pkg
-        mock_doc_repo.get_by_id.side_effect = lambda did: {
-            "doc-1": doc1, "doc-2": doc2,
-        }[did]
-        mock_file_storage.read_file.side_effect = lambda path: {
+        mock_doc_repo.get_many.return_value = {"doc-1": doc1, "doc-2": doc2}
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO({
             "documents/doc-1/doc1.pdf": b"pdf1",
             "documents/doc-2/doc2.pdf": b"pdf2",
             "documents/doc-1/signatures/s1.cms": b"sig1",
             "documents/doc-2/signatures/s2.cms": b"sig2",
-        }[path]
+        }[path])
 
         uc = DownloadSignedPackageUseCase(
             mock_doc_repo, mock_pkg_repo, mock_file_storage,
         )
-        zip_bytes, zip_filename = uc.execute("pkg-1", owner_id=1)
+        zip_chunks, zip_filename = uc.execute("pkg-1", owner_id=1)
 
         assert zip_filename == "package_pkg-1_signed.zip"
 
-        with zf.ZipFile(io.BytesIO(zip_bytes)) as z:
+        with zipfile.ZipFile(io.BytesIO(b"".join(zip_chunks))) as z:
             names = z.namelist()
             assert "originals/doc1.pdf" in names
             assert "originals/doc2.pdf" in names
@@ -633,12 +869,37 @@ class TestDownloadSignedPackageUseCase:
             assert z.read("originals/doc1.pdf") == b"pdf1"
             assert z.read("signatures/doc1.pdf.cms") == b"sig1"
 
-    def test_zip_excludes_failed_documents(
+    def test_zip_handles_members_above_zip64_limit(
         self, mock_doc_repo, mock_pkg_repo, mock_file_storage,
     ):
-        import zipfile as zf
-        import io
+        pkg = Package(id="pkg-1", title="Test", owner_id=1, document_ids=["doc-1"])
+        data = b"x" * 1000
+        doc = Document(
+            id="doc-1", title="Doc 1", filename="doc1.pdf",
+            mime_type="application/pdf", file_size=len(data),
+            file_path="documents/doc-1/doc1.pdf", owner_id=1,
+            status=DocumentStatus.SIGNED,
+            signature_file_path="documents/doc-1/signatures/s1.cms",
+        )
+        mock_pkg_repo.get_by_id.return_value = pkg
+        mock_doc_repo.get_many.return_value = {"doc-1": doc}
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO(data)
 
+        uc = DownloadSignedPackageUseCase(
+            mock_doc_repo, mock_pkg_repo, mock_file_storage,
+        )
+        # A small limit stands in for the real 2 GiB one.
+        with patch.object(zipfile, "ZIP64_LIMIT", 100):
+            zip_chunks, _ = uc.execute("pkg-1", owner_id=1)
+            archive = b"".join(zip_chunks)
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as z:
+            assert z.read("originals/doc1.pdf") == data
+            assert z.read("signatures/doc1.pdf.cms") == data
+
+    def test_zip_excludes_failed_documents(
+        self, mock_doc_repo, mock_pkg_repo, mock_file_storage,
+    ):
         pkg = Package(
             id="pkg-1", title="Test", owner_id=1,
             document_ids=["doc-1", "doc-2"],
@@ -655,24 +916,54 @@ class TestDownloadSignedPackageUseCase:
             status=DocumentStatus.FAILED,
         )
         mock_pkg_repo.get_by_id.return_value = pkg
-        mock_doc_repo.get_by_id.side_effect = lambda did: {
-            "doc-1": doc1, "doc-2": doc2,
-        }[did]
-        mock_file_storage.read_file.side_effect = lambda path: {
+        mock_doc_repo.get_many.return_value = {"doc-1": doc1, "doc-2": doc2}
+        mock_file_storage.open_stream.side_effect = lambda path: io.BytesIO({
             "documents/doc-1/doc1.pdf": b"pdf1",
             "documents/doc-1/signatures/s1.cms": b"sig1",
-        }[path]
+        }[path])
 
         uc = DownloadSignedPackageUseCase(
             mock_doc_repo, mock_pkg_repo, mock_file_storage,
         )
-        zip_bytes, _ = uc.execute("pkg-1", owner_id=1)
+        zip_chunks, _ = uc.execute("pkg-1", owner_id=1)
 
-        with zf.ZipFile(io.BytesIO(zip_bytes)) as z:
+        with zipfile.ZipFile(io.BytesIO(b"".join(zip_chunks))) as z:
             names = z.namelist()
             assert "originals/doc1.pdf" in names
             assert "originals/doc2.pdf" not in names
 
+    def test_abandoned_zip_closes_opened_streams(
+        self, mock_doc_repo, mock_pkg_repo, mock_file_storage,
+    ):
+        pkg = Package(
+            id="pkg-1", title="Test", owner_id=1, document_ids=["doc-1"],
+        )
+        doc1 = Document(
+            id="doc-1", title="Doc 1", filename="doc1.pdf",
+            file_path="documents/doc-1/doc1.pdf", owner_id=1,
+            status=DocumentStatus.SIGNED,
+            signature_file_path="documents/doc-1/signatures/s1.cms",
+        )
+        mock_pkg_repo.get_by_id.return_value = pkg
+        mock_doc_repo.get_many.return_value = {"doc-1": doc1}
+        opened = []
+
+        def open_stream(path):
+            opened.append(io.BytesIO(b"x" * 100))
+            return opened[-1]
+
+        mock_file_storage.open_stream.side_effect = open_stream
+
+        uc = DownloadSignedPackageUseCase(
+            mock_doc_repo, mock_pkg_repo, mock_file_storage,
+        )
+        zip_chunks, _ = uc.execute("pkg-1", owner_id=1)
+        next(zip_chunks)
+        zip_chunks.close()
+
+        assert opened
+        assert all(f.closed for f in opened)
+
     def test_package_not_found(
         self, mock_doc_repo, mock_pkg_repo, mock_file_storage,
     ):
@@ -693,3 +984,76 @@ class TestDownloadSignedPackageUseCase:
         )
         with pytest.raises(AccessDeniedError):
             uc.execute("pkg-1", owner_id=1)
+
+
+class _UnseekableStream:
+    """Iterable stream without seek/tell, like the S3 body open_stream returns."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buf.read(size)
+
+    def __iter__(self):
+        return iter(lambda: self._buf.read(4), b"")
+
+    def close(self) -> None:
+        self._buf.close()
+
+
+class TestStreamingToSigex:
+    """Stored files are streamed to a real SigexClient with a plain
+    Content-Length body, also when the storage stream cannot seek."""
+
+    DATA = b"test data"
+
+    @pytest.fixture
+    def sigex(self):
+        return SigexClient(base_url="https://sigex.kz", poll_retries=1)
+
+    @pytest.fixture
+    def storage(self, mock_file_storage):
+        mock_file_storage.open_stream.side_effect = (
+            lambda path: _UnseekableStream(self.DATA)
+        )
+        mock_file_storage.stat_with_digest.return_value = StorageStat(
+            size=len(self.DATA)
+        )
+        return mock_file_storage
+
+    @staticmethod
+    def _assert_length_framed(request, size):
+        assert request.headers["Content-Length"] == str(size)
+        assert "Transfer-Encoding" not in request.headers
+
+    @responses.activate
+    def test_upload_after_signing(self, sigex, storage):
+        responses.add(
+            responses.POST, "https://sigex.kz/api/sigex-1/data",
+            json={"documentId": "sigex-1", "digests": {}},
+        )
+        doc = Document(
+            id="doc-1", file_path="test.pdf", file_size=len(self.DATA), owner_id=1,
+        )
+
+        _upload_from_storage(doc, "sigex-1", storage, sigex)
+
+        self._assert_length_framed(responses.calls[0].request, len(self.DATA))
+
+    @responses.activate
+    def test_verify(self, sigex, storage, mock_doc_repo):
+        responses.add(
+            responses.POST, "https://sigex.kz/api/sigex-1/verify",
+            json={"documentId": "sigex-1"},
+        )
+        mock_doc_repo.get_by_id.return_value = Document(
+            id="doc-1", sha256=Document.compute_sha256(self.DATA),
+            file_path="test.pdf", owner_id=1, sigex_document_id="sigex-1",
+        )
+
+        uc = VerifyDocumentUseCase(mock_doc_repo, storage, sigex)
+        result = uc.execute("doc-1", owner_id=1)
+
+        assert result.verified is True
+        self._assert_length_framed(responses.calls[0].request, len(self.DATA))
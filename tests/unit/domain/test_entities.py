@@ -1,4 +1,7 @@
 import hashlib
+import io
+import time
+import uuid
 
 import pytest
 
@@ -12,9 +15,23 @@ from app.domain.entities import (
     SignatureStatus,
     SignerIdentity,
     SignerType,
+    new_id,
+    utcnow,
 )
 
 
+class TestNewId:
+    def test_is_uuid7(self):
+        parsed = uuid.UUID(new_id())
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_time_ordered(self):
+        first = new_id()
+        time.sleep(0.002)
+        assert new_id() > first
+
+
 class TestSignerIdentity:
     def test_valid_individual(self):
         signer = SignerIdentity(
@@ -51,6 +68,14 @@ class TestSignerIdentity:
                 signer_type=SignerType.INDIVIDUAL,
             )
 
+    def test_invalid_iin_non_ascii_digits(self):
+        with pytest.raises(ValueError, match="IIN must be a 12-digit"):
+            SignerIdentity(
+                iin="\u0661" * 12,
+                full_name="Test",
+                signer_type=SignerType.INDIVIDUAL,
+            )
+
     def test_empty_iin(self):
         with pytest.raises(ValueError, match="IIN must be a 12-digit"):
             SignerIdentity(
@@ -102,6 +127,28 @@ class TestDocument:
         doc = Document(sha256="wrong_hash")
         assert doc.verify_checksum(b"test data") is False
 
+    def test_verify_checksum_other_data(self):
+        doc = Document(sha256=Document.compute_sha256(b"test data"))
+        assert doc.verify_checksum(b"other data") is False
+
+    def test_verify_checksum_stream(self):
+        data = b"test data" * 100_000
+        doc = Document(sha256=Document.compute_sha256(data))
+        assert doc.verify_checksum(io.BytesIO(data)) is True
+
+    def test_compute_sha256_stream_without_readinto(self):
+        class ReadOnly:
+            def __init__(self, data):
+                self._buf = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self._buf.read(size)
+
+        data = b"x" * 1_000_000
+        assert Document.compute_sha256_stream(ReadOnly(data)) == (
+            hashlib.sha256(data).hexdigest()
+        )
+
     def test_validate_mime_type_pdf(self):
         doc = Document(mime_type="application/pdf")
         assert doc.validate_mime_type() is True
@@ -118,12 +165,28 @@ class TestDocument:
         doc = Document(mime_type="application/msword")
         assert doc.validate_mime_type() is False
 
+    def test_is_allowed_mime(self):
+        assert Document.is_allowed_mime("application/pdf") is True
+        assert Document.is_allowed_mime("application/msword") is False
+
     def test_mark_registered(self):
         doc = Document()
         doc.mark_registered("sigex-123")
         assert doc.status == DocumentStatus.REGISTERED
         assert doc.sigex_document_id == "sigex-123"
 
+    def test_mark_uses_given_time(self):
+        doc = Document()
+        now = utcnow()
+        doc.mark_failed("boom", now=now)
+        assert doc.updated_at is now
+
+    def test_timestamps_are_timezone_aware(self):
+        doc = Document()
+        doc.mark_signed()
+        assert doc.created_at.tzinfo is not None
+        assert doc.updated_at.tzinfo is not None
+
     def test_mark_signing(self):
         doc = Document()
         doc.mark_signing()
@@ -148,6 +211,11 @@ class TestDocument:
         doc2 = Document()
         assert doc1.id != doc2.id
 
+    def test_stem_and_ext(self):
+        doc = Document(filename="contract.v2.pdf")
+        assert doc.stem == "contract.v2"
+        assert doc.ext == ".pdf"
+
 
 class TestSignature:
     def test_mark_completed(self):
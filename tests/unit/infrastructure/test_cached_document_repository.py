@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.entities import Document, DocumentStatus
+from app.infrastructure.persistence.caching import CachedDocumentRepository, TTLCache
+
+
+@pytest.fixture
+def inner():
+    repo = MagicMock()
+    repo.get_by_id.side_effect = lambda doc_id: Document(id=doc_id, owner_id=1)
+    return repo
+
+
+@pytest.fixture
+def repo(inner):
+    return CachedDocumentRepository(inner, cache=TTLCache(maxsize=10, ttl=60))
+
+
+class TestCachedDocumentRepository:
+    def test_get_for_read_is_cached(self, repo, inner):
+        repo.get_for_read("doc-1")
+        repo.get_for_read("doc-1")
+        inner.get_by_id.assert_called_once_with("doc-1")
+
+    def test_get_by_id_is_not_cached(self, repo, inner):
+        repo.get_for_read("doc-1")
+        repo.get_by_id("doc-1")
+        repo.get_by_id("doc-1")
+        assert inner.get_by_id.call_count == 3
+
+    def test_returns_copies(self, repo):
+        doc = repo.get_for_read("doc-1")
+        doc.status = DocumentStatus.SIGNED
+        assert repo.get_for_read("doc-1").status == DocumentStatus.UPLOADED
+
+    def test_missing_is_not_cached(self, repo, inner):
+        inner.get_by_id.side_effect = None
+        inner.get_by_id.return_value = None
+        assert repo.get_for_read("nope") is None
+        assert repo.get_for_read("nope") is None
+        assert inner.get_by_id.call_count == 2
+
+    def test_update_invalidates(self, repo, inner):
+        repo.get_for_read("doc-1")
+        repo.update(Document(id="doc-1", owner_id=1))
+        repo.get_for_read("doc-1")
+        assert inner.get_by_id.call_count == 2
+
+    def test_entries_expire(self, inner):
+        repo = CachedDocumentRepository(inner, cache=TTLCache(maxsize=10, ttl=0))
+        repo.get_for_read("doc-1")
+        repo.get_for_read("doc-1")
+        assert inner.get_by_id.call_count == 2
@@ -1,3 +1,4 @@
+import io
 import os
 import tempfile
 
@@ -42,6 +43,64 @@ class TestLocalFileStorage:
         with pytest.raises(FileStorageError, match="Path traversal"):
             storage.save_file("../../etc/passwd", b"malicious")
 
+    def test_sibling_with_common_prefix_blocked(self, tmp_path):
+        base = tmp_path / "media"
+        storage = LocalFileStorage(base_dir=str(base))
+        with pytest.raises(FileStorageError, match="Path traversal"):
+            storage.save_file("../media2/file.txt", b"malicious")
+
     def test_delete_nonexistent_no_error(self, storage):
         # Should not raise
         storage.delete_file("nothing.txt")
+
+    def test_open_stream(self, storage):
+        storage.save_file("stream.txt", b"chunked data")
+        with storage.open_stream("stream.txt") as f:
+            assert f.read(7) == b"chunked"
+            assert f.read() == b" data"
+
+    def test_open_stream_nonexistent(self, storage):
+        with pytest.raises(FileStorageError, match="File not found"):
+            storage.open_stream("nonexistent.txt")
+
+    def test_save_stream(self, storage):
+        path = storage.save_stream("streamed/file.txt", io.BytesIO(b"streamed"))
+        assert storage.read_file(path) == b"streamed"
+
+    def test_save_stream_without_readinto(self, storage):
+        class ReadOnly:
+            def __init__(self, data):
+                self._buf = io.BytesIO(data)
+
+            def read(self, size=-1):
+                return self._buf.read(size)
+
+        path = storage.save_stream("streamed/file.txt", ReadOnly(b"streamed"))
+        assert storage.read_file(path) == b"streamed"
+
+    def test_link_file(self, storage):
+        storage.save_file("orig/file.pdf", b"signed content")
+        path = storage.link_file("orig/file.pdf", "copies/file-signed.pdf")
+        assert storage.read_file(path) == b"signed content"
+
+    def test_link_file_nonexistent(self, storage):
+        with pytest.raises(FileStorageError, match="File not found"):
+            storage.link_file("missing.pdf", "copy.pdf")
+
+    def test_stat_with_recorded_digest(self, storage):
+        storage.save_file("test/file.pdf", b"content")
+        storage.record_digest("test/file.pdf", "abc")
+        stat = storage.stat_with_digest("test/file.pdf")
+        assert stat.size == 7
+        assert stat.sha256 == "abc"
+
+    def test_stat_without_digest(self, storage):
+        storage.save_file("test/file.pdf", b"content")
+        assert storage.stat_with_digest("test/file.pdf").sha256 is None
+
+    def test_stat_ignores_stale_digest(self, storage):
+        storage.save_file("test/file.pdf", b"content")
+        storage.record_digest("test/file.pdf", "abc")
+        sidecar = storage._full_path("test/file.pdf.sha256")
+        os.utime(sidecar, ns=(0, 0))
+        assert storage.stat_with_digest("test/file.pdf").sha256 is None
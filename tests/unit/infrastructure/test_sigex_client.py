@@ -1,9 +1,12 @@
 """Tests for SigexClient with mocked HTTP responses."""
 
+import base64
+import io
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 import responses
 
 from app.domain.entities import QRSigningSession
@@ -18,6 +21,19 @@ from app.infrastructure.sigex.client import SigexClient
 BASE_URL = "https://sigex.kz"
 
 
+class _UnseekableStream:
+    """Iterable, read-only stream without seek/tell, like an S3 body."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._buf.read(size)
+
+    def __iter__(self):
+        return iter(lambda: self._buf.read(4), b"")
+
+
 @pytest.fixture
 def client():
     return SigexClient(
@@ -96,6 +112,24 @@ class TestSendDataForSigning:
         assert body["signMethod"] == "CMS_SIGN_ONLY"
         assert len(body["documentsToSign"]) == 1
 
+    @responses.activate
+    def test_raw_bytes_are_streamed_as_base64(self, client):
+        data_url = f"{BASE_URL}/api/egovQr/123/data"
+        responses.add(responses.POST, data_url, json={}, status=200)
+
+        raw = bytes(range(256)) * 5000
+        session = QRSigningSession(data_url=data_url, sign_url="")
+        client.send_data_for_signing(
+            session, [{"id": 1, "nameRu": "Test", "data": raw, "isPDF": True}]
+        )
+
+        request = responses.calls[0].request
+        sent = request.body
+        assert int(request.headers["Content-Length"]) == len(sent)
+        file = json.loads(sent)["documentsToSign"][0]["document"]["file"]
+        assert file["mime"] == "@file/pdf"
+        assert base64.b64decode(file["data"]) == raw
+
     @responses.activate
     def test_with_attach_data(self, client):
         data_url = f"{BASE_URL}/api/egovQr/123/data"
@@ -122,6 +156,35 @@ class TestSendDataForSigning:
         with pytest.raises(SigningError):
             client.send_data_for_signing(session, [{"id": 1, "nameRu": "T", "data": "x"}])
 
+    @responses.activate
+    def test_timeout_reposts_without_waiting(self, client):
+        data_url = f"{BASE_URL}/api/egovQr/123/data"
+        responses.add(responses.POST, data_url, body=requests.ReadTimeout())
+        responses.add(responses.POST, data_url, body=requests.ReadTimeout())
+        responses.add(responses.POST, data_url, json={}, status=200)
+
+        session = QRSigningSession(data_url=data_url, sign_url="")
+        with patch("app.infrastructure.sigex.client.time.sleep") as sleep:
+            client.send_data_for_signing(session, [{"nameRu": "T", "data": "x"}])
+
+        assert len(responses.calls) == 3
+        sleep.assert_not_called()
+
+    @responses.activate
+    def test_errors_back_off_exponentially(self):
+        client = SigexClient(base_url=BASE_URL, poll_retries=4)
+        data_url = f"{BASE_URL}/api/egovQr/123/data"
+        responses.add(responses.POST, data_url, status=503)
+
+        session = QRSigningSession(data_url=data_url, sign_url="")
+        with patch("app.infrastructure.sigex.client.time.sleep") as sleep, \
+                patch("app.infrastructure.sigex.client.random.uniform", return_value=0):
+            with pytest.raises(SigningError):
+                client.send_data_for_signing(session, [{"nameRu": "T", "data": "x"}])
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert delays == [1, 2, 4]
+
 
 class TestPollSignatures:
     @responses.activate
@@ -159,6 +222,39 @@ class TestPollSignatures:
         with pytest.raises(SigningTimeoutError):
             client.poll_signatures(session)
 
+    @responses.activate
+    def test_delay_grows_up_to_poll_interval(self):
+        client = SigexClient(base_url=BASE_URL, poll_retries=6, poll_interval=2)
+        sign_url = f"{BASE_URL}/api/egovQr/123/sign"
+        responses.add(
+            responses.GET, sign_url, json={"message": "Not ready yet"}, status=200
+        )
+
+        session = QRSigningSession(data_url="", sign_url=sign_url)
+        with patch("app.infrastructure.sigex.client.time.sleep") as sleep:
+            with pytest.raises(SigningTimeoutError):
+                client.poll_signatures(session)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert delays == [0.5, 0.75, 1.125, 1.6875, 2]
+
+    @responses.activate
+    def test_errors_back_off_exponentially(self):
+        client = SigexClient(
+            base_url=BASE_URL, poll_retries=5, poll_interval=2, max_retry_interval=6
+        )
+        sign_url = f"{BASE_URL}/api/egovQr/123/sign"
+        responses.add(responses.GET, sign_url, status=503)
+
+        session = QRSigningSession(data_url="", sign_url=sign_url)
+        with patch("app.infrastructure.sigex.client.time.sleep") as sleep, \
+                patch("app.infrastructure.sigex.client.random.uniform", return_value=0):
+            with pytest.raises(SigningTimeoutError):
+                client.poll_signatures(session)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert delays == [2, 4, 6, 6]
+
     @responses.activate
     def test_cancelled(self, client):
         sign_url = f"{BASE_URL}/api/egovQr/123/sign"
@@ -237,6 +333,39 @@ class TestUploadDocumentData:
         digests = client.upload_document_data("doc-1", b"file content")
         assert "1.2.3" in digests
 
+    @responses.activate
+    def test_stream_with_size(self, client):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/doc-1/data",
+            json={"documentId": "doc-1", "digests": {}},
+            status=200,
+        )
+
+        client.upload_document_data("doc-1", io.BytesIO(b"file content"), size=12)
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Length"] == "12"
+        assert "Transfer-Encoding" not in request.headers
+
+    @responses.activate
+    def test_unseekable_stream_is_sent_with_content_length(self, client):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/doc-1/data",
+            json={"documentId": "doc-1", "digests": {}},
+            status=200,
+        )
+
+        client.upload_document_data(
+            "doc-1", _UnseekableStream(b"file content"), size=12
+        )
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Length"] == "12"
+        assert "Transfer-Encoding" not in request.headers
+        assert request.body == b"file content"
+
 
 class TestAddSignature:
     @responses.activate
@@ -277,6 +406,21 @@ class TestVerifyDocument:
         with pytest.raises(VerificationError):
             client.verify_document("doc-1", b"file data")
 
+    @responses.activate
+    def test_unseekable_stream_is_sent_with_content_length(self, client):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/doc-1/verify",
+            json={"documentId": "doc-1"},
+            status=200,
+        )
+
+        client.verify_document("doc-1", _UnseekableStream(b"file data"), size=9)
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Length"] == "9"
+        assert "Transfer-Encoding" not in request.headers
+
 
 class TestGetDocumentInfo:
     @responses.activate